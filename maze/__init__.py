@@ -1 +1,2 @@
 from maze.maze import *
+from maze import batch
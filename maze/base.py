@@ -2,8 +2,11 @@ import numpy as np
 import ctypes
 import enum
 import os
+import warnings
 from PIL import Image
 
+import maze.mapped as mapped
+import maze.png as png
 import maze.utils as util
 
 
@@ -11,77 +14,178 @@ class MazeBase(object):
     """This class contains base functions."""
     class Create(enum.Enum):
         """Enum for creation algorithms."""
-        C            = "Recursive backtracking algorithm C"
-        BACKTRACKING = "Recursive backtracking algorithm"
-        HUNT         = "Hunt and kill algorithm"
-        ELLER        = "Eller's algorithm"
-        SIDEWINDER   = "Sidewinder algorithm"
-        PRIM         = "Prim's algorithm"
-        KRUSKAL      = "Kruskal's algorithm"
+        C             = "Recursive backtracking algorithm C"
+        BACKTRACKING  = "Recursive backtracking algorithm"
+        HUNT          = "Hunt and kill algorithm"
+        HUNT_C        = "Hunt and kill algorithm C"
+        ELLER         = "Eller's algorithm"
+        ELLER_C       = "Eller's algorithm C"
+        SIDEWINDER    = "Sidewinder algorithm"
+        SIDEWINDER_C  = "Sidewinder algorithm C"
+        BINARY_TREE   = "Binary tree algorithm"
+        BINARY_TREE_C = "Binary tree algorithm C"
+        PRIM          = "Prim's algorithm"
+        PRIM_C        = "Prim's algorithm C"
+        KRUSKAL       = "Kruskal's algorithm"
+        KRUSKAL_C     = "Kruskal's algorithm C"
+
+    # Python algorithms which create mazes instead of C algorithms if the C library is not available
+    FALLBACKS = {
+        Create.C:             Create.BACKTRACKING,
+        Create.HUNT_C:        Create.HUNT,
+        Create.ELLER_C:       Create.ELLER,
+        Create.SIDEWINDER_C:  Create.SIDEWINDER,
+        Create.BINARY_TREE_C: Create.BINARY_TREE,
+        Create.PRIM_C:        Create.PRIM,
+        Create.KRUSKAL_C:     Create.KRUSKAL
+    }
 
     class Solve(enum.Enum):
         """Enum for solving algorithms."""
-        C       = "Depth-first search C"
-        DEPTH   = "Depth-first search"
-        BREADTH = "Breadth-first search"
+        C               = "Depth-first search C"
+        DEPTH           = "Depth-first search"
+        BREADTH         = "Breadth-first search"
+        BREADTH_C       = "Breadth-first search C"
+        A_STAR_C        = "A* search C"
+        BIDIRECTIONAL   = "Bidirectional breadth-first search"
+        BIDIRECTIONAL_C = "Bidirectional breadth-first search C"
+        DEAD_END        = "Dead-end filling"
+        TREE            = "Tree decomposition"
 
     def __init__(self):
         """Constructor."""
         self.maze = None
         self.solution = None
+        self.seed = None
+        self.algorithm = None
         self._dll = None
 
     @property
     def row_count_with_walls(self):
         """Returns the mazes row count with walls."""
-        return self.maze.shape[0]
+        return 2 * self.row_count + 1
 
     @property
     def col_count_with_walls(self):
         """Returns the mazes column count with walls."""
-        return self.maze.shape[1]
+        return 2 * self.col_count + 1
 
     @property
     def row_count(self):
         """Returns the mazes row count."""
-        return self.row_count_with_walls // 2
+        return self.maze.shape[0]
 
     @property
     def col_count(self):
         """Returns the mazes column count."""
-        return self.col_count_with_walls // 2
+        return self.maze.shape[1]
 
     def _load_dll(self):
         """Loads the dll and sets parameter types."""
-        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bin", "maze64.dll")
-        self._dll = ctypes.cdll.LoadLibrary(path)
-        
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), util.library_name())
         ndpointer = np.ctypeslib.ndpointer(ctypes.c_uint8, flags="C_CONTIGUOUS")
+        ndpointer_int = np.ctypeslib.ndpointer(ctypes.c_int64, flags="C_CONTIGUOUS")
+
+        try:
+            dll = ctypes.cdll.LoadLibrary(path)
+
+            # The C functions keep their state in local contexts and ctypes releases the GIL while they run,
+            # so mazes can be created and solved from several threads at once
+            for name in ("recursive_backtracking", "hunt_and_kill", "prim"):
+                getattr(dll, name).argtypes = [
+                    ndpointer, ctypes.c_int64, ctypes.c_int64, ctypes.c_int64, ctypes.c_uint64
+                ]
+
+            for name in ("eller", "sidewinder", "binary_tree", "kruskal"):
+                getattr(dll, name).argtypes = [
+                    ndpointer, ctypes.c_int64, ctypes.c_int64, ctypes.c_uint64
+                ]
+
+            for name in ("depth_first_search", "breadth_first_search", "a_star", "bidirectional_search"):
+                getattr(dll, name).argtypes = [
+                    ndpointer, ndpointer_int, ctypes.c_int64, ctypes.c_int64, ctypes.c_int64, ctypes.c_int64
+                ]
+                getattr(dll, name).restype = ctypes.c_int64
+        except (OSError, AttributeError) as error:  # Library is missing or from an older build without all functions
+            warnings.warn(
+                "Cannot load C library <{}>: {}\n"
+                "Falling back to the Python algorithms. "
+                "Reinstall the package with a C compiler available to build it.".format(path, error),
+                util.MazeWarning
+            )
+            self._dll = False
+            return
 
-        self._dll.recursive_backtracking.argtypes = [
-            ndpointer, ctypes.c_int, ctypes.c_int, ctypes.c_int
-        ]
+        self._dll = dll
 
-        self._dll.depth_first_search.argtypes = [
-            ndpointer, ndpointer, ctypes.c_int, ctypes.c_int, ctypes.c_int
-        ]
+    @staticmethod
+    def _algorithm(name):
+        """Returns the creation algorithm of a name stored in a maze file or None if it is unknown."""
+        return MazeBase.Create.__members__.get(name)
 
     def get_dll(self):
-        """Returns the loaded dll."""
+        """Returns the loaded dll or None if it is not available."""
         if self._dll is None:
             self._load_dll()
 
-        return self._dll
+        return self._dll or None
+
+    def _bands(self, path=None):
+        """Yields the RGB image with walls and an optional path in bands of rows."""
+        band_count = max(1, 2 ** 18 // self.col_count)  # Rows of cells in one band
+
+        if path is not None:
+            rows, cols, colors = util.path_pixels(path)
+            order = np.argsort(rows, kind="stable")  # Sort pixels by rows to find them for each band
+            rows, cols, colors = rows[order], cols[order], colors[order]
 
-    def save_maze(self, file_name="maze.png", scale=3):
-        """Saves the maze as png."""
+        for x in range(0, self.row_count, band_count):
+            band = util.to_rgb_tile(self.maze, x, 0, band_count, self.col_count)
+            if x + band_count < self.row_count:
+                band = band[:-1]  # Last wall row is the first one of the next band
+
+            if path is not None:
+                lo, hi = np.searchsorted(rows, [2 * x, 2 * x + len(band)])
+                band[rows[lo:hi] - 2 * x, cols[lo:hi]] = colors[lo:hi]
+
+            yield band
+
+    def _save_png(self, file_name, scale, path=None):
+        """Saves the maze with an optional path as png, the image is created and upscaled in bands of rows."""
+        png.write(file_name, self._bands(path), self.col_count_with_walls, self.row_count_with_walls, scale)
+
+    def save_maze(self, file_name="maze.png", scale=3, format="png", compress=False):
+        """
+        Saves the maze as png, npz or raw binary maze file.
+
+        The npz and raw formats store the cells directly and ignore the scale, npz files are compressed on demand.
+        """
         if self.maze is None:
             raise util.MazeError(
                 "Cannot save maze because it is not assigned.\n"
                 "Use the \"create\" or \"load_maze\" method to create or load a maze."
             )
 
-        Image.fromarray(util.upscale(self.maze, scale), "RGB").save(file_name, "png")
+        if format == "png":
+            self._save_png(file_name, scale)
+        elif format == "npz":
+            arrays = {"maze": self.maze}
+            if self.seed is not None:
+                arrays["seed"] = np.uint64(self.seed)
+            if self.algorithm is not None:
+                arrays["algorithm"] = np.array(self.algorithm.name)
+            with open(file_name, "wb") as file:  # Prevent numpy from appending the extension
+                if compress:
+                    np.savez_compressed(file, **arrays)
+                else:
+                    np.savez(file, **arrays)
+        elif format == "raw":
+            mapped.save(file_name, self.maze, self.algorithm, self.seed)
+        else:
+            raise util.MazeError(
+                "Wrong format <{}>.\n"
+                "Use \"png\", \"npz\" or \"raw\" to choose a format.".format(format)
+            )
 
     def save_solution(self, file_name="solution.png", scale=3):
         """Saves the solution as png."""
@@ -91,11 +195,54 @@ class MazeBase(object):
                 "Use the \"solve\" method to solve a maze."
             )
 
-        Image.fromarray(util.upscale(self.solution, scale), "RGB").save(file_name, "png")
+        self._save_png(file_name, scale, self.solution)
 
-    def load_maze(self, file_name="maze.png"):
-        """Loads the maze from png."""
+    def load_maze(self, file_name="maze.png", format=None):
+        """Loads the maze from png, npz or raw binary maze file, the format is guessed from the extension by default."""
         if not os.path.isfile(file_name):
             raise util.MazeError("Cannot load maze because <{}> does not exist.".format(file_name))
 
-        self.maze = util.downscale(np.array(Image.open(file_name)))
+        if format is None:
+            format = {".npz": "npz", ".maze": "raw"}.get(os.path.splitext(file_name)[1].lower(), "png")
+
+        if format == "png":
+            self.maze = util.from_rgb(util.downscale(np.array(Image.open(file_name))))
+            self.seed = None  # Pictures do not store the seed and algorithm
+            self.algorithm = None
+        elif format == "npz":
+            with np.load(file_name) as data:
+                self.maze = data["maze"].astype(np.uint8, copy=False)
+                self.seed = int(data["seed"]) if "seed" in data.files else None
+                self.algorithm = self._algorithm(str(data["algorithm"])) if "algorithm" in data.files else None
+        elif format == "raw":
+            header, self.maze = mapped.read(file_name)
+            self.seed = header.seed
+            self.algorithm = self._algorithm(header.algorithm)
+        else:
+            raise util.MazeError(
+                "Wrong format <{}>.\n"
+                "Use \"png\", \"npz\" or \"raw\" to choose a format.".format(format)
+            )
+        self.solution = None  # Solution belongs to the previous maze
+
+    def map_maze(self, file_name="maze.maze", writable=False):
+        """Maps the maze from a binary maze file into memory, its cells are read from disk on demand."""
+        if not os.path.isfile(file_name):
+            raise util.MazeError("Cannot map maze because <{}> does not exist.".format(file_name))
+
+        header, self.maze = mapped.load(file_name, writable)
+        self.seed = header.seed
+        self.algorithm = self._algorithm(header.algorithm)
+        self.solution = None
+
+    def render_tile(self, x, y, row_count, col_count, scale=1):
+        """Renders the RGB image with walls of a tile of the maze, only the cells of the tile are read."""
+        if self.maze is None:
+            raise util.MazeError(
+                "Cannot render tile because the maze is not assigned.\n"
+                "Use the \"create\", \"load_maze\" or \"map_maze\" method to create or load a maze."
+            )
+        if not (0 <= x < self.row_count and 0 <= y < self.col_count) or row_count <= 0 or col_count <= 0:
+            raise util.MazeError("Tile <{}> is out of range.".format((x, y, row_count, col_count)))
+
+        return util.upscale(util.to_rgb_tile(self.maze, x, y, row_count, col_count), scale)
@@ -0,0 +1,134 @@
+import collections
+import concurrent.futures
+import itertools
+import numbers
+import os
+import random
+
+import numpy as np
+
+import maze.utils as utils
+import maze.vectorized as vectorized
+from maze.maze import Maze
+
+EXTENSIONS = {"png": ".png", "npz": ".npz", "raw": ".maze"}  # File extensions of formats, see Maze.load_maze
+CHUNK_CELLS = 2 ** 18  # Number of cells of the mazes created in one chunk by a worker process
+
+
+def _seeds(n, seeds):
+    """Returns a list of n seeds for the given seeds argument."""
+    if seeds is None:
+        return [random.getrandbits(64) for _ in range(n)]
+    if isinstance(seeds, numbers.Integral):  # Includes NumPy integers
+        rng = random.Random(int(seeds))
+        return [rng.getrandbits(64) for _ in range(n)]
+
+    seeds = [Maze._seed(seed) for seed in seeds]  # Plain integers, random.Random rejects NumPy integers
+    if len(seeds) != n:
+        raise utils.MazeError("Expected <{}> seeds but got <{}>.".format(n, len(seeds)))
+
+    return seeds
+
+
+def generate_stacked(n, row_count, col_count, algorithm, seed=None):
+    """
+    Creates n mazes at once and returns them as array of shape (n, rows, cols).
+
+    The algorithm advances all mazes together row by row, which is fast for many small mazes.
+    Only the sidewinder, binary tree and Eller's algorithm are supported.
+    """
+    if n < 0 or row_count <= 0 or col_count <= 0:
+        raise utils.MazeError("Maze count, row or column count cannot be smaller than zero.")
+
+    if seed is not None:
+        seed = Maze._seed(seed)
+
+    mazes = np.zeros((n, row_count, col_count), dtype=np.uint8)
+    rng = np.random.default_rng(seed)
+
+    if algorithm in (Maze.Create.SIDEWINDER, Maze.Create.SIDEWINDER_C):
+        vectorized.sidewinder(mazes, rng)
+    elif algorithm in (Maze.Create.BINARY_TREE, Maze.Create.BINARY_TREE_C):
+        vectorized.binary_tree(mazes, rng)
+    elif algorithm in (Maze.Create.ELLER, Maze.Create.ELLER_C):
+        vectorized.eller(mazes, rng)
+    else:
+        raise utils.MazeError(
+            "Algorithm <{}> cannot create stacked mazes.\n"
+            "Use the sidewinder, binary tree or Eller's algorithm.".format(algorithm)
+        )
+
+    return mazes
+
+
+def _create(job):
+    """Creates a single maze and returns it or the file it was saved to."""
+    row_count, col_count, algorithm, seed, file_name, format = job
+
+    m = Maze()
+    m.create(row_count, col_count, algorithm, seed)
+    if file_name is None:
+        return m.maze
+
+    m.save_maze(file_name, format=format)
+    return file_name
+
+
+def _create_chunk(jobs):
+    """Creates the mazes of a chunk of jobs, which sends many small mazes at once."""
+    return [_create(job) for job in jobs]
+
+
+def generate(n, row_count, col_count, algorithm, seeds=None, workers=None, directory=None, format="npz"):
+    """
+    Creates n mazes in a process pool and returns a generator which yields them in order.
+
+    Seeds can be None for random mazes, an int to derive reproducible seeds for all mazes or one seed for each maze.
+    Yields the maze arrays or, if a directory is given, the file names of the mazes saved in it as png, npz or raw.
+    Only a few chunks of mazes are created ahead, closing the generator cancels the remaining ones.
+    """
+    if n < 0 or row_count <= 0 or col_count <= 0:
+        raise utils.MazeError("Maze count, row or column count cannot be smaller than zero.")
+    if format not in EXTENSIONS:
+        raise utils.MazeError(
+            "Wrong format <{}>.\n"
+            "Use \"png\", \"npz\" or \"raw\" to choose a format.".format(format)
+        )
+
+    seeds = _seeds(n, seeds)
+    file_names = [None] * n
+    if directory is not None:
+        os.makedirs(directory, exist_ok=True)
+        file_names = [os.path.join(directory, "maze_{}{}".format(i, EXTENSIONS[format])) for i in range(n)]
+
+    jobs = [
+        (row_count, col_count, algorithm, seed, file_name, format) for seed, file_name in zip(seeds, file_names)
+    ]
+
+    workers = workers or os.cpu_count() or 1
+    chunk_size = max(1, min(n // (4 * workers), CHUNK_CELLS // (row_count * col_count)))
+
+    return _generate(jobs, workers, chunk_size)
+
+
+def _generate(jobs, workers, chunk_size):
+    """Yields the results of jobs which are created in chunks by a process pool."""
+    if workers == 1:
+        for job in jobs:
+            yield _create(job)
+        return
+
+    chunks = (jobs[i:i + chunk_size] for i in range(0, len(jobs), chunk_size))
+    executor = concurrent.futures.ProcessPoolExecutor(workers)
+    try:
+        pending = collections.deque(
+            executor.submit(_create_chunk, chunk) for chunk in itertools.islice(chunks, 2 * workers)
+        )
+        while pending:
+            results = pending.popleft().result()
+            for chunk in itertools.islice(chunks, 1):  # Keep the window of chunks filled
+                pending.append(executor.submit(_create_chunk, chunk))
+            for result in results:
+                yield result
+    finally:
+        executor.shutdown(cancel_futures=True)  # Only waits for chunks which are already being created
@@ -0,0 +1,79 @@
+import collections
+import struct
+
+import numpy as np
+
+import maze.utils as utils
+
+# Binary maze files start with a header followed by the passages of cells with one byte for each cell in row-major
+# order, see utils.SOUTH and utils.EAST. The cells are mapped into memory and read from or written to disk on demand.
+
+MAGIC = b"MAZE"
+VERSION = 1
+HEADER = struct.Struct("<4sHHQQQ32s")  # Magic, version, flags, row count, column count, seed, algorithm
+FLAG_SEED = 1  # Header contains a seed
+
+Header = collections.namedtuple("Header", ["row_count", "col_count", "algorithm", "seed"])
+
+
+def read_header(file_name):
+    """Reads the header of a binary maze file."""
+    with open(file_name, "rb") as file:
+        data = file.read(HEADER.size)
+    if len(data) != HEADER.size:
+        raise utils.MazeError("File <{}> is not a binary maze file.".format(file_name))
+
+    magic, version, flags, row_count, col_count, seed, algorithm = HEADER.unpack(data)
+    if magic != MAGIC:
+        raise utils.MazeError("File <{}> is not a binary maze file.".format(file_name))
+    if version != VERSION:
+        raise utils.MazeError("Binary maze file <{}> has unsupported version <{}>.".format(file_name, version))
+
+    return Header(
+        row_count, col_count, algorithm.rstrip(b"\0").decode("ascii") or None, seed if flags & FLAG_SEED else None
+    )
+
+
+def write_header(file, row_count, col_count, algorithm=None, seed=None):
+    """Writes the header of a binary maze file."""
+    name = algorithm.name if algorithm is not None else ""
+    file.write(HEADER.pack(
+        MAGIC, VERSION, FLAG_SEED if seed is not None else 0, row_count, col_count, seed or 0, name.encode("ascii")
+    ))
+
+
+def create(file_name, row_count, col_count, algorithm=None, seed=None):
+    """Creates a binary maze file and returns its cells mapped into memory for writing."""
+    with open(file_name, "wb") as file:
+        write_header(file, row_count, col_count, algorithm, seed)
+        file.truncate(HEADER.size + row_count * col_count)  # Reserve cells, new bytes are zero
+
+    return np.memmap(file_name, dtype=np.uint8, mode="r+", offset=HEADER.size, shape=(row_count, col_count))
+
+
+def save(file_name, cells, algorithm=None, seed=None):
+    """Saves cells as binary maze file."""
+    with open(file_name, "wb") as file:
+        write_header(file, cells.shape[0], cells.shape[1], algorithm, seed)
+        np.ascontiguousarray(cells, dtype=np.uint8).tofile(file)
+
+
+def read(file_name):
+    """Returns the header and the cells of a binary maze file read into memory."""
+    header = read_header(file_name)
+    cells = np.fromfile(file_name, dtype=np.uint8, count=header.row_count * header.col_count, offset=HEADER.size)
+    if cells.size != header.row_count * header.col_count:
+        raise utils.MazeError("Binary maze file <{}> is truncated.".format(file_name))
+
+    return header, cells.reshape((header.row_count, header.col_count))
+
+
+def load(file_name, writable=False):
+    """Returns the header and the cells of a binary maze file mapped into memory."""
+    header = read_header(file_name)
+    cells = np.memmap(
+        file_name, dtype=np.uint8, mode="r+" if writable else "r", offset=HEADER.size,
+        shape=(header.row_count, header.col_count)
+    )
+
+    return header, cells
@@ -1,9 +1,14 @@
 import numpy as np
 import collections
+import itertools
+import operator
 import random
 
 import maze.utils as utils
 import maze.base as base
+import maze.mapped as mapped
+import maze.tree as tree
+import maze.vectorized as vectorized
 
 
 class Maze(base.MazeBase):
@@ -12,41 +17,97 @@ class Maze(base.MazeBase):
         """Constructor."""
         super(Maze, self).__init__()
 
-        self._dir_one = [
-            lambda x, y: (x + 1, y),
-            lambda x, y: (x - 1, y),
-            lambda x, y: (x, y - 1),
-            lambda x, y: (x, y + 1)
-        ]
-        self._dir_two = [
-            lambda x, y: (x + 2, y),
-            lambda x, y: (x - 2, y),
-            lambda x, y: (x, y - 2),
-            lambda x, y: (x, y + 2)
-        ]
-        self._range = list(range(4))
-
-    def create(self, row_count, col_count, algorithm):
-        """Creates a maze for a given row and column count."""
-        if (row_count or col_count) <= 0:
+        self._orders = list(itertools.permutations(range(4)))  # Orders of directions south, north, west and east
+        self._offsets = (0, 0, 0, 0)  # Offsets of flat indices of adjacent cells in directions
+        self._bounds = b""  # Directions of cells within bounds as bit masks
+        self._rng = random.Random()
+        self._np_rng = np.random.default_rng()
+        self._tree = None
+
+    def create(self, row_count, col_count, algorithm, seed=None, file_name=None):
+        """
+        Creates a maze for a given row and column count, the same seed creates the same maze.
+
+        Seeds only reproduce mazes of the same implementation, C algorithms fall back to Python ones which create other
+        mazes if the C library is not available. The algorithm which created the maze is stored in algorithm.
+        If a file name is given, the maze is created within a binary maze file which is mapped into memory.
+        """
+        if row_count <= 0 or col_count <= 0:
             raise utils.MazeError("Row or column count cannot be smaller than zero.")
-
-        self.maze = np.zeros((2 * row_count + 1, 2 * col_count + 1, 3), dtype=np.uint8)
-
+        if not isinstance(algorithm, Maze.Create):  # Check before a maze file is created
+            raise utils.MazeError(
+                "Wrong algorithm <{}>.\n"
+                "Use \"Maze.Create.<algorithm>\" to choose an algorithm.".format(algorithm)
+            )
+        if seed is not None:
+            seed = Maze._seed(seed)
+
+        self.seed = seed if seed is not None else random.getrandbits(64)
+        self.algorithm = self._implementation(algorithm)
+        self._rng = random.Random(self.seed)
+        self._np_rng = np.random.default_rng(self._rng.getrandbits(64))
+
+        if file_name is None:
+            self.maze = np.zeros((row_count, col_count), dtype=np.uint8)  # Passages of cells, see utils.SOUTH and utils.EAST
+        else:
+            self.maze = mapped.create(file_name, row_count, col_count, self.algorithm, self.seed)
+
+        self._offsets = (col_count, -col_count, -1, 1)
+        self.solution = None  # Solution belongs to the previous maze
+
+        self._create(algorithm)
+        if file_name is not None:
+            self.maze.flush()  # Write cells to disk
+
+    @staticmethod
+    def _seed(seed):
+        """Converts a seed into an integer which is stored as unsigned 64 bit integer in maze files."""
+        try:
+            seed = operator.index(seed)
+        except TypeError:
+            raise utils.MazeError("Seed <{}> is not an integer.".format(seed))
+        if not 0 <= seed < 2 ** 64:
+            raise utils.MazeError("Seed <{}> must be between 0 and 2 ** 64 - 1.".format(seed))
+
+        return seed
+
+    def _implementation(self, algorithm):
+        """Returns the algorithm which creates the maze, which is the Python one for C algorithms without library."""
+        if algorithm in Maze.FALLBACKS and self.get_dll() is None:
+            return Maze.FALLBACKS[algorithm]
+
+        return algorithm
+
+    def _create(self, algorithm):
+        """Creates a maze using an algorithm."""
         if algorithm == Maze.Create.C:
             return self._recursive_backtracking_c()
         if algorithm == Maze.Create.BACKTRACKING:
             return self._recursive_backtracking()
         if algorithm == Maze.Create.HUNT:
             return self._hunt_and_kill()
+        if algorithm == Maze.Create.HUNT_C:
+            return self._hunt_and_kill_c()
         if algorithm == Maze.Create.ELLER:
             return self._eller()
+        if algorithm == Maze.Create.ELLER_C:
+            return self._eller_c()
         if algorithm == Maze.Create.SIDEWINDER:
             return self._sidewinder()
+        if algorithm == Maze.Create.SIDEWINDER_C:
+            return self._sidewinder_c()
+        if algorithm == Maze.Create.BINARY_TREE:
+            return self._binary_tree()
+        if algorithm == Maze.Create.BINARY_TREE_C:
+            return self._binary_tree_c()
         if algorithm == Maze.Create.PRIM:
             return self._prim()
+        if algorithm == Maze.Create.PRIM_C:
+            return self._prim_c()
         if algorithm == Maze.Create.KRUSKAL:
             return self._kruskal()
+        if algorithm == Maze.Create.KRUSKAL_C:
+            return self._kruskal_c()
 
         raise utils.MazeError(
             "Wrong algorithm <{}>.\n"
@@ -55,16 +116,27 @@ class Maze(base.MazeBase):
 
     @property
     def _random(self):
-        """Returns a random range to iterate over."""
-        random.shuffle(self._range)
-        return self._range
-
-    def _out_of_bounds(self, x, y):
-        """Checks if indices are out of bounds."""
-        return x < 0 or y < 0 or x >= self.row_count_with_walls or y >= self.col_count_with_walls
-
-    def solve(self, start, end, algorithm):
-        """Solves a maze from start to finish."""
+        """Returns a random order of directions to iterate over."""
+        return self._orders[self._rng.randrange(24)]
+
+    def _inside(self):
+        """Returns the directions of cells within bounds as flat bit masks."""
+        inside = np.ones(self.maze.shape, dtype=bool)
+        return utils.directions(inside, inside).tobytes()
+
+    def _carve(self, passages, idx, direction):
+        """Carves a passage from a cell to its neighbour in direction."""
+        if direction < 2:
+            passages[min(idx, idx + self._offsets[direction])] |= utils.SOUTH
+        else:
+            passages[min(idx, idx + self._offsets[direction])] |= utils.EAST
+
+    def solve(self, start, end, algorithm, render=True):
+        """
+        Solves a maze from start to finish and returns the path as array of cells [[x, y], ...].
+
+        The path is also stored as solution for rendering unless render is False, which clears the previous solution.
+        """
         if self.maze is None:
             raise utils.MazeError(
                 "Maze is not assigned.\n"
@@ -79,355 +151,566 @@ class Maze(base.MazeBase):
         if not (0 <= end[0] < self.row_count and 0 <= end[1] < self.col_count):
             raise utils.MazeError("End point <{}> is out of range.".format(end))
 
-        start = tuple([2 * x + 1 for x in start])
-        end = tuple([2 * x + 1 for x in end])
+        start = tuple(start)
+        end = tuple(end)
+        self._offsets = (self.col_count, -self.col_count, -1, 1)
 
-        self.solution = self.maze.copy()
+        path = self._solve(start, end, algorithm)
+        self.solution = path if render else None
 
+        return path
+
+    def _solve(self, start, end, algorithm):
+        """Solves a maze using an algorithm and returns the path."""
         if algorithm == Maze.Solve.C:
             return self._depth_first_search_c(start, end)
         if algorithm == Maze.Solve.DEPTH:
             return self._depth_first_search(start, end)
         if algorithm == Maze.Solve.BREADTH:
             return self._breadth_first_search(start, end)
+        if algorithm == Maze.Solve.BREADTH_C:
+            return self._breadth_first_search_c(start, end)
+        if algorithm == Maze.Solve.A_STAR_C:
+            return self._a_star_c(start, end)
+        if algorithm == Maze.Solve.BIDIRECTIONAL:
+            return self._bidirectional_search(start, end)
+        if algorithm == Maze.Solve.BIDIRECTIONAL_C:
+            return self._bidirectional_search_c(start, end)
+        if algorithm == Maze.Solve.DEAD_END:
+            return self._dead_end_filling(start, end)
+        if algorithm == Maze.Solve.TREE:
+            return self.spanning_tree().path(start, end)
 
         raise utils.MazeError(
             "Wrong algorithm <{}>.\n"
             "Use \"Algorithm.Solve.<algorithm>\" to choose an algorithm.".format(algorithm)
         )
 
+    def spanning_tree(self):
+        """
+        Returns the tree decomposition of a perfect maze, which is built once for each maze.
+
+        Changing the cells of the maze in place requires to create or load it again.
+        """
+        if self.maze is None:
+            raise utils.MazeError(
+                "Maze is not assigned.\n"
+                "Use the \"create\" or \"load_maze\" method to create or load a maze."
+            )
+
+        if self._tree is None or self._tree.maze is not self.maze:
+            self._tree = tree.Tree(self.maze)
+
+        return self._tree
+
     def _recursive_backtracking_c(self):
         """Creates a maze using the recursive backtracking algorithm in C."""
-        row_count, col_count = self.row_count, self.col_count
-        row_count_with_walls, col_count_with_walls = self.row_count_with_walls, self.col_count_with_walls
+        dll = self.get_dll()
+        if dll is None:
+            return self._recursive_backtracking()
 
-        x = 2 * random.randint(0, row_count - 1) + 1
-        y = 2 * random.randint(0, col_count - 1) + 1
-        idx = x * col_count_with_walls + y
+        idx = self._rng.randint(0, self.maze.size - 1)
 
-        self.maze = self.maze[:, :, ::3].flatten()
-        self.get_dll().recursive_backtracking(
-            self.maze, row_count, col_count, idx
+        dll.recursive_backtracking(
+            self.maze, self.row_count, self.col_count, idx, self._rng.getrandbits(64)
         )
-        self.maze = self.maze.reshape((row_count_with_walls, col_count_with_walls, 1))
-        self.maze = self.maze.repeat(3, axis=2)
 
-    def _create_walk(self, x, y):
-        """Randomly walks from one pointer within the maze to another one."""
-        for idx in self._random:  # Check adjacent cells randomly
-            tx, ty = self._dir_two[idx](x, y)
-            if not self._out_of_bounds(tx, ty) and self.maze[tx, ty, 0] == 0:  # Check if unvisited
-                self.maze[tx, ty] = self.maze[self._dir_one[idx](x, y)] = [255, 255, 255]  # Mark as visited
-                return tx, ty  # Return new cell
+    def _create_walk(self, idx, visited, passages):
+        """Randomly walks from one cell within the maze to another one."""
+        bounds = self._bounds[idx]
+        for direction in self._random:  # Check adjacent cells randomly
+            if bounds >> direction & 1:
+                tidx = idx + self._offsets[direction]
+                if not visited[tidx]:  # Check if unvisited
+                    visited[tidx] = True  # Mark as visited
+                    self._carve(passages, idx, direction)
+                    return tidx  # Return new cell
 
-        return None, None  # Return stop values
+        return None  # Return stop value
 
-    def _create_backtrack(self, stack):
+    def _create_backtrack(self, stack, visited):
         """Backtracks the stack until walking is possible again."""
         while stack:
-            x, y = stack.pop()
-            for direction in self._dir_two:  # Check adjacent cells
-                tx, ty = direction(x, y)
-                if not self._out_of_bounds(tx, ty) and self.maze[tx, ty, 0] == 0:  # Check if unvisited
-                    return x, y  # Return cell with unvisited neighbour
+            idx = stack.pop()
+            bounds = self._bounds[idx]
+            for direction in range(4):  # Check adjacent cells
+                if bounds >> direction & 1 and not visited[idx + self._offsets[direction]]:  # Check if unvisited
+                    return idx  # Return cell with unvisited neighbour
 
-        return None, None  # Return stop values if stack is empty
+        return None  # Return stop value if stack is empty
 
     def _recursive_backtracking(self):
         """Creates a maze using the recursive backtracking algorithm."""
-        stack = collections.deque()  # List of visited cells [(x, y), ...]
+        self._bounds = self._inside()
+        visited = bytearray(self.maze.size)  # Visited cells
+        passages = bytearray(self.maze.size)  # Passages of cells
+        stack = []  # List of visited cells [idx, ...]
+
+        idx = self._rng.randint(0, self.maze.size - 1)
+        visited[idx] = True  # Mark as visited
+
+        while idx is not None:
+            while idx is not None:
+                stack.append(idx)
+                idx = self._create_walk(idx, visited, passages)
+            idx = self._create_backtrack(stack, visited)
+
+        self.maze |= np.frombuffer(passages, dtype=np.uint8).reshape(self.maze.shape)
+
+    def _hunt_and_kill_c(self):
+        """Creates a maze using the hunt and kill algorithm in C."""
+        dll = self.get_dll()
+        if dll is None:
+            return self._hunt_and_kill()
 
-        x = 2 * random.randint(0, self.row_count - 1) + 1
-        y = 2 * random.randint(0, self.col_count - 1) + 1
-        self.maze[x, y] = [255, 255, 255]  # Mark as visited
+        idx = self._rng.randint(0, self.maze.size - 1)
 
-        while x and y:
-            while x and y:
-                stack.append((x, y))
-                x, y = self._create_walk(x, y)
-            x, y = self._create_backtrack(stack)
+        dll.hunt_and_kill(
+            self.maze, self.row_count, self.col_count, idx, self._rng.getrandbits(64)
+        )
 
-    def _hunt(self, hunt_list):
+    def _hunt(self, hunt_list, unvisited, visited, passages):
         """Scans the maze for new position."""
-        while hunt_list:
-            for x in hunt_list:
-                finished = True
-                for y in range(1, self.col_count_with_walls - 1, 2):
-                    if self.maze[x, y, 0] == 0:  # Check if unvisited
-                        finished = False
-                        for direction in self._dir_two:  # Check adjacent cells
-                            tx, ty = direction(x, y)
-                            if not self._out_of_bounds(tx, ty) and self.maze[tx, ty, 0] == 255:  # Check if visited
-                                return x, y  # Return visited neighbour of unvisited cell
-                if finished:
-                    hunt_list.remove(x)  # Remove finished row
-                    break  # Restart loop
-
-        return None, None  # Return stop values if all rows are finished
+        while hunt_list and unvisited[hunt_list[0]] == 0:
+            hunt_list.popleft()  # Remove finished rows
+
+        grid = np.frombuffer(visited, dtype=bool).reshape(self.maze.shape)  # Visited cells as array
+        for x in hunt_list:
+            if unvisited[x] == 0:  # Skip finished row
+                continue
+
+            # Mark cells with visited neighbour
+            bordered = np.zeros(self.col_count, dtype=bool)
+            if x > 0:
+                bordered |= grid[x - 1]
+            if x < self.row_count - 1:
+                bordered |= grid[x + 1]
+            bordered[1:] |= grid[x, :-1]
+            bordered[:-1] |= grid[x, 1:]
+
+            found = np.flatnonzero(bordered & ~grid[x])  # Unvisited cells with visited neighbour
+            if found.size:
+                idx = x * self.col_count + int(found[0])
+                bounds = self._bounds[idx]
+                for direction in self._random:  # Check adjacent cells randomly
+                    if bounds >> direction & 1 and visited[idx + self._offsets[direction]]:  # Check if visited
+                        visited[idx] = True  # Mark as visited
+                        self._carve(passages, idx, direction)  # Connect with visited neighbour
+                        return idx  # Return new cell
+
+        return None  # Return stop value if all rows are finished
 
     def _hunt_and_kill(self):
         """Creates a maze using the hunt and kill algorithm."""
-        hunt_list = list(range(1, self.row_count_with_walls - 1, 2))  # List of unfinished rows [x, ...]
-
-        x = 2 * random.randint(0, self.row_count - 1) + 1
-        y = 2 * random.randint(0, self.col_count - 1) + 1
-        self.maze[x, y] = [255, 255, 255]  # Mark as visited
+        self._bounds = self._inside()
+        visited = bytearray(self.maze.size)  # Visited cells
+        passages = bytearray(self.maze.size)  # Passages of cells
+        unvisited = [self.col_count] * self.row_count  # Number of unvisited cells in rows [count, ...]
+        hunt_list = collections.deque(range(self.row_count))  # List of unfinished rows [x, ...]
+
+        idx = self._rng.randint(0, self.maze.size - 1)
+        visited[idx] = True  # Mark as visited
+
+        while idx is not None:
+            while idx is not None:
+                unvisited[idx // self.col_count] -= 1  # Count visited cell
+                idx = self._create_walk(idx, visited, passages)
+            idx = self._hunt(hunt_list, unvisited, visited, passages)
+
+        self.maze |= np.frombuffer(passages, dtype=np.uint8).reshape(self.maze.shape)
+
+    def _eller_c(self):
+        """Creates a maze using Eller's algorithm in C."""
+        dll = self.get_dll()
+        if dll is None:
+            return self._eller()
 
-        while hunt_list:
-            while x and y:
-                x, y = self._create_walk(x, y)
-            x, y = self._hunt(hunt_list)
+        dll.eller(self.maze, self.row_count, self.col_count, self._rng.getrandbits(64))
 
     def _eller(self):
         """Creates a maze using Eller's algorithm."""
-        row_stack = [0] * self.col_count  # List of set indices [set index, ...]
-        set_list = []  # List of set indices with positions [(set index, position), ...]
-        set_index = 1
-
-        for x in range(1, self.row_count_with_walls - 1, 2):
-            connect_list = collections.deque()  # List of connections between cells [True, ...]
-
-            # Create row stack
-            if row_stack[0] == 0:  # Define first cell in row
-                row_stack[0] = set_index
-                set_index += 1
-
-            for y in range(1, self.col_count):  # Define other cells in row
-                if random.getrandbits(1):  # Connect cell with previous cell
-                    if row_stack[y] != 0:  # Cell has a set
-                        old_index = row_stack[y]
-                        new_index = row_stack[y - 1]
-                        if old_index != new_index:  # Combine both sets
-                            row_stack = [new_index if y == old_index else y for y in row_stack]  # Replace old indices
-                            connect_list.append(True)
-                        else:
-                            connect_list.append(False)
-                    else:  # Cell has no set
-                        row_stack[y] = row_stack[y - 1]
-                        connect_list.append(True)
-                else:  # Do not connect cell with previous cell
-                    if row_stack[y] == 0:
-                        row_stack[y] = set_index
-                        set_index += 1
-                    connect_list.append(False)
-
-            # Create set list and fill cells
-            for y in range(self.col_count):
-                maze_col = 2 * y + 1
-                set_list.append((row_stack[y], maze_col))
-
-                self.maze[x, maze_col] = [255, 255, 255]  # Mark as visited
-                if y < self.col_count - 1:
-                    if connect_list.popleft():
-                        self.maze[x, maze_col + 1] = [255, 255, 255]  # Mark as visited
-
-            if x == self.row_count_with_walls - 2:  # Connect all different sets in last row
-                for y in range(1, self.col_count):
-                    new_index = row_stack[y - 1]
-                    old_index = row_stack[y]
-                    if new_index != old_index:
-                        row_stack = [new_index if y == old_index else y for y in row_stack]  # Replace old indices
-                        self.maze[x, 2 * y] = [255, 255, 255]  # Mark as visited
-                break  # End loop with last row
-
-            # Reset row stack
-            row_stack = [0] * self.col_count
-
-            # Create vertical links
-            set_list.sort(reverse=True)
-            while set_list:
-                sub_set_list = collections.deque()  # List of set indices with positions for one set index [(set index, position), ...]
-                sub_set_index = set_list[-1][0]
-                while set_list and set_list[-1][0] == sub_set_index:  # Create sub list for one set index
-                    sub_set_list.append(set_list.pop())
-                linked = False
-                while not linked:  # Create at least one link for each set index
-                    for sub_set_item in sub_set_list:
-                        if random.getrandbits(1):  # Create link
-                            linked = True
-                            link_set, link_position = sub_set_item
-
-                            row_stack[link_position // 2] = link_set  # Assign links to new row stack
-                            self.maze[x + 1, link_position] = [255, 255, 255]  # Mark link as visited
+        for x, row in enumerate(self._eller_rows(self.col_count, self.row_count, self._np_rng)):
+            self.maze[x] = row
+
+    @staticmethod
+    def stream_eller(col_count, row_count=None, seed=None):
+        """
+        Creates a maze using Eller's algorithm and yields it row by row in constant memory.
+
+        Without a row count the maze grows endlessly, sending True to the generator makes the next row the last one.
+        The same seed yields the rows of the maze created by create with Maze.Create.ELLER.
+        """
+        if col_count <= 0 or (row_count is not None and row_count <= 0):
+            raise utils.MazeError("Row or column count cannot be smaller than zero.")
+
+        seed = Maze._seed(seed) if seed is not None else random.getrandbits(64)
+        rng = np.random.default_rng(random.Random(seed).getrandbits(64))  # Seeded like in create
+
+        return Maze._eller_rows(col_count, row_count, rng)
+
+    @staticmethod
+    def _eller_rows(col_count, row_count, rng):
+        """Yields the rows of a maze created with Eller's algorithm."""
+        cols = np.arange(col_count)
+        labels = (col_count + cols).tolist()  # Set labels of cells, unlinked cells get new sets
+        x = 0
+        last = row_count == 1
+
+        while True:
+            parent = list(range(2 * col_count))  # Disjoint-set forest of set labels
+            east = rng.integers(0, 2, size=col_count, dtype=bool).tolist()  # Connections with next cells [True, ...]
+            east[-1] = False
+
+            # Connect cells with previous cells
+            new_index = labels[0]
+            for y in range(1, col_count):
+                old_index = utils.set_find(parent, labels[y])
+                if old_index == new_index:  # Only connect cells of different sets
+                    east[y - 1] = False
+                elif east[y - 1] or last:  # Connect all different sets in last row
+                    east[y - 1] = True
+                    parent[old_index] = new_index  # Combine both sets
+                    old_index = new_index
+                new_index = old_index
+
+            row = np.array(east, dtype=np.uint8) * utils.EAST  # Passages of cells in row
+            if last:
+                yield row
+                return  # End with last row
+
+            # Create vertical links, at least one for each set
+            roots = np.array([utils.set_find(parent, label) for label in labels])
+            down = rng.integers(0, 2, size=col_count, dtype=bool)
+            linked = np.zeros(2 * col_count, dtype=bool)
+            linked[roots[down]] = True
+
+            priority = rng.random(col_count)
+            priority[linked[roots]] = -1  # Only choose cells of sets without link
+            best = np.full(2 * col_count, -1.0)
+            np.maximum.at(best, roots, priority)
+            down |= (priority == best[roots]) & (priority >= 0)
+            row |= down.astype(np.uint8) * utils.SOUTH
+
+            # Carry sets down, label them with the first column of the set that links down
+            first = np.full(2 * col_count, col_count)
+            np.minimum.at(first, roots[down], cols[down])
+            labels = np.where(down, first[roots], col_count + cols).tolist()
+
+            finish = yield row
+            x += 1
+            last = bool(finish) or (row_count is not None and x == row_count - 1)  # Next row is the last one
+
+    def _sidewinder_c(self):
+        """Creates a maze using the sidewinder algorithm in C."""
+        dll = self.get_dll()
+        if dll is None:
+            return self._sidewinder()
+
+        dll.sidewinder(self.maze, self.row_count, self.col_count, self._rng.getrandbits(64))
 
     def _sidewinder(self):
         """Creates a maze using the sidewinder algorithm."""
-        # Create first row
-        for y in range(1, self.col_count_with_walls - 1):
-            self.maze[1, y] = [255, 255, 255]
-
-        # Create other rows
-        for x in range(3, self.row_count_with_walls, 2):
-            row_stack = []  # List of cells without vertical link [y, ...]
-            for y in range(1, self.col_count_with_walls - 2, 2):
-                self.maze[x, y] = [255, 255, 255]  # Mark as visited
-                row_stack.append(y)
-
-                if random.getrandbits(1):  # Create vertical link
-                    idx = random.randint(0, len(row_stack) - 1)
-                    self.maze[x - 1, row_stack[idx]] = [255, 255, 255]  # Mark as visited
-                    row_stack = []  # Reset row stack
-                else:  # Create horizontal link
-                    self.maze[x, y + 1] = [255, 255, 255]  # Mark as visited
-
-            # Create vertical link if last cell
-            y = self.col_count_with_walls - 2
-            self.maze[x, y] = [255, 255, 255]  # Mark as visited
-            row_stack.append(y)
-            idx = random.randint(0, len(row_stack) - 1)
-            self.maze[x - 1, row_stack[idx]] = [255, 255, 255]  # Mark as visited
+        vectorized.sidewinder(self.maze, self._np_rng)
+
+    def _binary_tree_c(self):
+        """Creates a maze using the binary tree algorithm in C."""
+        dll = self.get_dll()
+        if dll is None:
+            return self._binary_tree()
+
+        dll.binary_tree(self.maze, self.row_count, self.col_count, self._rng.getrandbits(64))
+
+    def _binary_tree(self):
+        """Creates a maze using the binary tree algorithm."""
+        vectorized.binary_tree(self.maze, self._np_rng)
+
+    def _prim_c(self):
+        """Creates a maze using Prim's algorithm in C."""
+        dll = self.get_dll()
+        if dll is None:
+            return self._prim()
+
+        idx = self._rng.randint(0, self.maze.size - 1)
+
+        dll.prim(
+            self.maze, self.row_count, self.col_count, idx, self._rng.getrandbits(64)
+        )
+
+    def _neighbours(self, idx):
+        """Returns the flat indices of adjacent cells."""
+        bounds = self._bounds[idx]
+        return [idx + self._offsets[direction] for direction in range(4) if bounds >> direction & 1]
 
     def _prim(self):
         """Creates a maze using Prim's algorithm."""
-        frontier = []  # List of unvisited cells [(x, y),...]
+        self._bounds = self._inside()
+        state = bytearray(self.maze.size)  # State of cells, 0 is unvisited, 1 frontier, 2 visited
+        passages = bytearray(self.maze.size)  # Passages of cells
+        frontier = []  # List of frontier cells [idx, ...]
 
         # Start with random cell
-        x = 2 * random.randint(0, self.row_count - 1) + 1
-        y = 2 * random.randint(0, self.col_count - 1) + 1
-        self.maze[x, y] = [255, 255, 255]  # Mark as visited
+        idx = self._rng.randint(0, self.maze.size - 1)
+        state[idx] = 2  # Mark as visited
 
         # Add cells to frontier for random cell
-        for direction in self._dir_two:
-            tx, ty = direction(x, y)
-            if not self._out_of_bounds(tx, ty):
-                frontier.append((tx, ty))
-                self.maze[tx, ty, 0] = 1  # Mark as part of frontier
+        for tidx in self._neighbours(idx):
+            frontier.append(tidx)
+            state[tidx] = 1  # Mark as part of frontier
 
         # Add and connect cells until frontier is empty
         while frontier:
-            x, y = frontier.pop(random.randint(0, len(frontier) - 1))
-
-            # Connect cells
-            for idx in self._random:
-                tx, ty = self._dir_two[idx](x, y)
-                if not self._out_of_bounds(tx, ty) and self.maze[tx, ty, 0] == 255:  # Check if visited
-                    self.maze[x, y] = self.maze[self._dir_one[idx](x, y)] = [255, 255, 255]  # Connect cells
-                    break
+            # Remove random cell by swapping it with the last one
+            rnd = self._rng.randint(0, len(frontier) - 1)
+            idx = frontier[rnd]
+            frontier[rnd] = frontier[-1]
+            frontier.pop()
+
+            # Connect cell with random visited neighbour
+            neighbours = self._neighbours(idx)
+            tidx = self._rng.choice([tidx for tidx in neighbours if state[tidx] == 2])
+            passages[min(idx, tidx)] |= utils.SOUTH if abs(idx - tidx) == self.col_count else utils.EAST
+            state[idx] = 2  # Mark as visited
 
             # Add cells to frontier
-            for direction in self._dir_two:
-                tx, ty = direction(x, y)
-                if not self._out_of_bounds(tx, ty) and self.maze[tx, ty, 0] == 0:  # Check if unvisited
-                    frontier.append((tx, ty))
-                    self.maze[tx, ty, 0] = 1  # Mark as part of frontier
+            for tidx in neighbours:
+                if state[tidx] == 0:  # Check if unvisited
+                    frontier.append(tidx)
+                    state[tidx] = 1  # Mark as part of frontier
 
-    def _kruskal(self):
-        """Creates a maze using Kruskal's algorithm."""
-        xy_to_set = np.zeros((self.row_count_with_walls, self.col_count_with_walls), dtype=np.uint32)
-        set_to_xy = []  # List of sets in order, set 0 at index 0 [[(x, y),...], ...]
-        edges = collections.deque()  # List of possible edges [(x, y, direction), ...]
-        set_index = 0
+        self.maze |= np.frombuffer(passages, dtype=np.uint8).reshape(self.maze.shape)
 
-        for x in range(1, self.row_count_with_walls - 1, 2):
-            for y in range(1, self.col_count_with_walls - 1, 2):
-                # Assign sets
-                xy_to_set[x, y] = set_index
-                set_to_xy.append([(x, y)])
-                set_index += 1
+    def _kruskal_c(self):
+        """Creates a maze using Kruskal's algorithm in C."""
+        dll = self.get_dll()
+        if dll is None:
+            return self._kruskal()
 
-                # Create edges
-                if not self._out_of_bounds(x + 2, y):
-                    edges.append((x + 1, y, "v"))  # Vertical edge
-                if not self._out_of_bounds(x, y + 2):
-                    edges.append((x, y + 1, "h"))  # Horizontal edge
+        dll.kruskal(self.maze, self.row_count, self.col_count, self._rng.getrandbits(64))
 
-        random.shuffle(edges)  # Shuffle to pop random edges
-        while edges:
-            x, y, direction = edges.pop()
+    def _kruskal(self):
+        """Creates a maze using Kruskal's algorithm."""
+        cells = np.arange(self.maze.size).reshape(self.maze.shape)  # Flat cell indices
+        edges = np.concatenate((
+            2 * cells[:-1].ravel(),  # Vertical edges, cell with direction bit 0
+            2 * cells[:, :-1].ravel() + 1  # Horizontal edges, cell with direction bit 1
+        ))
+        self._np_rng.shuffle(edges)  # Shuffle to take random edges
+
+        parent = list(range(self.maze.size))  # Disjoint-set forest of cells
+        rank = [0] * self.maze.size
+        links = []  # List of chosen edges [edge, ...]
+
+        for edge in edges.tolist():
+            idx1 = edge >> 1
+            idx2 = idx1 + 1 if edge & 1 else idx1 + self.col_count
+            if utils.set_union(parent, rank, idx1, idx2):  # Check if cells were in different sets
+                links.append(edge)
+                if len(links) == self.maze.size - 1:  # Stop if all cells are in one set
+                    break
 
-            x1, x2 = (x - 1, x + 1) if direction == "v" else (x, x)
-            y1, y2 = (y - 1, y + 1) if direction == "h" else (y, y)
+        # Connect cells
+        links = np.array(links, dtype=np.intp)
+        self.maze[np.divmod(links[(links & 1) == 0] >> 1, self.col_count)] |= utils.SOUTH
+        self.maze[np.divmod(links[(links & 1) == 1] >> 1, self.col_count)] |= utils.EAST
 
-            if xy_to_set[x1, y1] != xy_to_set[x2, y2]:  # Check if cells are in different sets
-                self.maze[x, y] = self.maze[x1, y1] = self.maze[x2, y2] = [255, 255, 255]  # Mark as visited
+    def _cells(self, path):
+        """Converts flat indices of a path into an array of cells [[x, y], ...]."""
+        path = np.asarray(path, dtype=np.intp)
+        return np.column_stack(np.divmod(path, self.col_count))
 
-                new_set = xy_to_set[x1, y1]
-                old_set = xy_to_set[x2, y2]
+    def _solve_c(self, function, start, end):
+        """Solves a maze using a C function which writes the path."""
+        start = start[0] * self.col_count + start[1]
+        end = end[0] * self.col_count + end[1]
 
-                # Extend new set with old set
-                set_to_xy[new_set].extend(set_to_xy[old_set])
+        path = np.empty(self.maze.size, dtype=np.int64)  # Cell indices of path
+        length = function(
+            self.maze, path, self.row_count, self.col_count, start, end
+        )
+        if length == 0:
+            raise utils.MazeError("No solution found.")
 
-                # Correct sets in xy sets
-                for pos in set_to_xy[old_set]:
-                    xy_to_set[pos] = new_set
+        return self._cells(path[:length])
 
     def _depth_first_search_c(self, start, end):
         """Solves a maze using depth-first search in C."""
-        start = start[0] * self.col_count_with_walls + start[1]
-        end = end[0] * self.col_count_with_walls + end[1]
+        dll = self.get_dll()
+        if dll is None:
+            return self._depth_first_search(start, end)
 
-        self.solution = self.solution.flatten()
-        self.get_dll().depth_first_search(
-            self.maze[:, :, ::3].flatten(), self.solution, self.col_count, start, end
-        )
-        self.solution = self.solution.reshape((self.row_count_with_walls, self.col_count_with_walls, 3))
+        return self._solve_c(dll.depth_first_search, start, end)
 
-    def _solve_walk(self, x, y, visited):
+    def _breadth_first_search_c(self, start, end):
+        """Solves a maze using breadth-first search in C."""
+        dll = self.get_dll()
+        if dll is None:
+            return self._breadth_first_search(start, end)
+
+        return self._solve_c(dll.breadth_first_search, start, end)
+
+    def _a_star_c(self, start, end):
+        """Solves a maze using A* search with Manhattan distance in C."""
+        dll = self.get_dll()
+        if dll is None:
+            return self._breadth_first_search(start, end)
+
+        return self._solve_c(dll.a_star, start, end)
+
+    def _openings(self):
+        """Returns the directions of open passages of cells as flat bit masks."""
+        return utils.directions(self.maze & utils.SOUTH != 0, self.maze & utils.EAST != 0).tobytes()
+
+    def _bidirectional_search_c(self, start, end):
+        """Solves a maze using bidirectional breadth-first search in C."""
+        dll = self.get_dll()
+        if dll is None:
+            return self._bidirectional_search(start, end)
+
+        return self._solve_c(dll.bidirectional_search, start, end)
+
+    def _solve_walk(self, idx, visited, openings):
         """Walks over a maze."""
-        for idx in range(4):  # Check adjacent cells
-            bx, by = self._dir_one[idx](x, y)
-            if visited[bx, by, 0] == 255:  # Check if unvisited
-                tx, ty = self._dir_two[idx](x, y)
-                visited[bx, by, 0] = visited[tx, ty, 0] = 0  # Mark as visited
-                return tx, ty  # Return new cell
+        directions = openings[idx]
+        for direction in range(4):  # Check adjacent cells
+            if directions >> direction & 1:
+                tidx = idx + self._offsets[direction]
+                if not visited[tidx]:  # Check if unvisited
+                    visited[tidx] = True  # Mark as visited
+                    return tidx  # Return new cell
 
-        return None, None  # Return stop values
+        return None  # Return stop value
 
-    def _solve_backtrack(self, stack, visited):
+    def _solve_backtrack(self, stack, visited, openings):
         """Backtracks a stacks."""
         while stack:
-            x, y = stack.pop()
-            for direction in self._dir_one:  # Check adjacent cells
-                tx, ty = direction(x, y)
-                if visited[tx, ty, 0] == 255:  # Check if unvisited
-                    return x, y  # Return cell with unvisited neighbour
+            idx = stack.pop()
+            directions = openings[idx]
+            for direction in range(4):  # Check adjacent cells
+                if directions >> direction & 1 and not visited[idx + self._offsets[direction]]:  # Check if unvisited
+                    return idx  # Return cell with unvisited neighbour
 
-        return None, None  # Return stop values if stack is empty and no new cell was found
+        return None  # Return stop value if stack is empty and no new cell was found
 
     def _depth_first_search(self, start, end):
         """Solves a maze using depth-first search."""
-        visited = self.maze.copy()  # List of visited cells, value of visited cell is 0
-        stack = collections.deque()  # List of visited cells [(x, y), ...]
-
-        x, y = start
-        visited[x, y, 0] = 0  # Mark as visited
-
-        while x and y:
-            while x and y:
-                stack.append((x, y))
-                if (x, y) == end:  # Stop if end has been found
-                    return utils.draw_path(self.solution, stack)
-                x, y = self._solve_walk(x, y, visited)
-            x, y = self._solve_backtrack(stack, visited)
+        visited = bytearray(self.maze.size)  # Visited cells
+        openings = self._openings()
+        stack = []  # List of visited cells [idx, ...]
+
+        idx = start[0] * self.col_count + start[1]
+        end = end[0] * self.col_count + end[1]
+        visited[idx] = True  # Mark as visited
+
+        while idx is not None:
+            while idx is not None:
+                stack.append(idx)
+                if idx == end:  # Stop if end has been found
+                    return self._cells(stack)
+                idx = self._solve_walk(idx, visited, openings)
+            idx = self._solve_backtrack(stack, visited, openings)
 
         raise utils.MazeError("No solution found.")
 
-    def _enqueue(self, queue, visited):
+    def _enqueue(self, queue, visited, openings):
         """Queues next cells."""
         cell = queue.popleft()
-        x, y = cell[0]
-        for idx in range(4):  # Check adjacent cells
-            bx, by = self._dir_one[idx](x, y)
-            if visited[bx, by, 0] == 255:  # Check if unvisited
-                tx, ty = self._dir_two[idx](x, y)
-                visited[bx, by, 0] = visited[tx, ty, 0] = 0  # Mark as visited
-                queue.append(utils.stack_push(cell, (tx, ty)))
+        idx = cell[0]
+        directions = openings[idx]
+        for direction in range(4):  # Check adjacent cells
+            if directions >> direction & 1:
+                tidx = idx + self._offsets[direction]
+                if not visited[tidx]:  # Check if unvisited
+                    visited[tidx] = True  # Mark as visited
+                    queue.append(utils.stack_push(cell, tidx))
 
     def _breadth_first_search(self, start, end):
         """Solves a maze using breadth-first search."""
-        visited = self.maze.copy()  # List of visited cells, value of visited cell is 0
+        visited = bytearray(self.maze.size)  # Visited cells
+        openings = self._openings()
         queue = collections.deque()  # List of cells [cell, ...]
-        cell = utils.stack_empty()  # Tuple of current cell with according stack ((x, y), stack)
+        cell = utils.stack_empty()  # Tuple of current cell with according stack (idx, stack)
 
-        x, y = start
-        cell = utils.stack_push(cell, (x, y))
+        idx = start[0] * self.col_count + start[1]
+        end = end[0] * self.col_count + end[1]
+        cell = utils.stack_push(cell, idx)
         queue.append(cell)
-        visited[x, y, 0] = 0  # Mark as visited
+        visited[idx] = True  # Mark as visited
 
         while queue:
-            self._enqueue(queue, visited)
             if queue[0][0] == end:  # Stop if end has been found
-                cell = utils.stack_push(queue[0], end)  # Push end into cell
-                return utils.draw_path(self.solution, utils.stack_deque(cell))
+                return self._cells(utils.stack_deque(queue[0]))
+            self._enqueue(queue, visited, openings)
 
         raise utils.MazeError("No solution found.")
+
+    def _bidirectional_search(self, start, end):
+        """Solves a maze using breadth-first search from start and end until both searches meet."""
+        openings = self._openings()
+        parent = [-1] * self.maze.size  # Parents of cells towards start or end
+        side = bytearray(self.maze.size)  # Search which visited cells, 0 is none, 1 from start, 2 from end
+        frontiers = {1: [], 2: []}  # Cells of the current level of both searches [idx, ...]
+
+        start = start[0] * self.col_count + start[1]
+        end = end[0] * self.col_count + end[1]
+        if start == end:
+            return self._cells([start])
+
+        for current, idx in ((1, start), (2, end)):
+            side[idx] = current  # Mark as visited
+            frontiers[current].append(idx)
+
+        while frontiers[1] and frontiers[2]:
+            current = 1 if len(frontiers[1]) <= len(frontiers[2]) else 2  # Expand smaller frontier
+            frontier = []
+            for idx in frontiers[current]:
+                directions = openings[idx]
+                for direction in range(4):  # Check adjacent cells
+                    if directions >> direction & 1:
+                        tidx = idx + self._offsets[direction]
+                        if side[tidx] == 0:  # Check if unvisited
+                            side[tidx] = current  # Mark as visited
+                            parent[tidx] = idx
+                            frontier.append(tidx)
+                        elif side[tidx] != current:  # Stop if searches meet
+                            return self._join(parent, *((idx, tidx) if current == 1 else (tidx, idx)))
+            frontiers[current] = frontier
+
+        raise utils.MazeError("No solution found.")
+
+    def _join(self, parent, from_start, from_end):
+        """Joins the path from start to a cell with the path from its neighbour to end."""
+        path = []
+        while from_start != -1:
+            path.append(from_start)
+            from_start = parent[from_start]
+        path.reverse()
+        while from_end != -1:
+            path.append(from_end)
+            from_end = parent[from_end]
+
+        return self._cells(path)
+
+    def _dead_end_filling(self, start, end):
+        """Solves a maze using dead-end filling."""
+        openings = self._openings()
+        idx = start[0] * self.col_count + start[1]
+        last = end[0] * self.col_count + end[1]
+        remaining = tree.dead_end_filling(self.maze, idx, last).tobytes()  # Cells which are not filled
+
+        # Follow the remaining cells from start to end
+        path = [idx]
+        previous = -1
+        while idx != last:
+            directions = openings[idx]
+            following = [
+                idx + self._offsets[direction] for direction in range(4)
+                if directions >> direction & 1 and remaining[idx + self._offsets[direction]]
+                and idx + self._offsets[direction] != previous
+            ]
+            if len(following) != 1:  # Path is not unique if the maze is not perfect or start and end are not connected
+                return self._breadth_first_search(start, end)
+
+            previous, idx = idx, following[0]
+            path.append(idx)
+
+        return self._cells(path)
@@ -0,0 +1,66 @@
+import itertools
+import struct
+import zlib
+
+import numpy as np
+
+import maze.utils as utils
+
+# Writes RGB images as png while they are created, so only a band of rows is kept in memory at once
+
+SIGNATURE = b"\x89PNG\r\n\x1a\n"
+CHUNK_SIZE = 2 ** 16  # Size of compressed data in one IDAT chunk
+FILTER_NONE = b"\x00"  # Scanline is stored as is
+FILTER_UP = b"\x02"  # Scanline is stored as difference to the previous one
+
+
+def write_chunk(file, kind, data):
+    """Writes a png chunk."""
+    file.write(struct.pack(">I", len(data)))
+    file.write(kind)
+    file.write(data)
+    file.write(struct.pack(">I", zlib.crc32(data, zlib.crc32(kind)) & 0xFFFFFFFF))
+
+
+def write(file_name, bands, width, height, scale=1, level=6):
+    """
+    Writes bands of an RGB image as png, each pixel is upscaled to a square of scale pixels on the fly.
+
+    Bands are arrays of shape (rows, width, 3) which together contain height rows.
+    """
+    scale = max(1, scale)
+    compressor = zlib.compressobj(level)
+    repeat = FILTER_UP + bytes(3 * width * scale)  # Repeated scanlines do not differ from the previous one
+    data = []  # List of compressed data for the next IDAT chunk [bytes, ...]
+    size = 0
+    row_count = 0
+
+    with open(file_name, "wb") as file:
+        file.write(SIGNATURE)
+        write_chunk(file, b"IHDR", struct.pack(">IIBBBBB", width * scale, height * scale, 8, 2, 0, 0, 0))
+
+        for band in bands:
+            band = np.ascontiguousarray(band, dtype=np.uint8)
+            if band.ndim != 3 or band.shape[1:] != (width, 3):
+                raise utils.MazeError("Band of shape <{}> does not fit image width <{}>.".format(band.shape, width))
+
+            for row in band:
+                scanlines = (FILTER_NONE, row.repeat(scale, axis=0).tobytes())
+                for scanline in itertools.chain(scanlines, itertools.repeat(repeat, scale - 1)):
+                    compressed = compressor.compress(scanline)
+                    data.append(compressed)
+                    size += len(compressed)
+
+                if size >= CHUNK_SIZE:
+                    write_chunk(file, b"IDAT", b"".join(data))
+                    data = []
+                    size = 0
+
+            row_count += len(band)
+
+        if row_count != height:
+            raise utils.MazeError("Bands contain <{}> rows instead of <{}>.".format(row_count, height))
+
+        data.append(compressor.flush())
+        write_chunk(file, b"IDAT", b"".join(data))
+        write_chunk(file, b"IEND", b"")
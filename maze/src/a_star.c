@@ -0,0 +1,74 @@
+#include "a_star.h"
+
+#include <stdlib.h>
+
+#include "directions.h"
+#include "heap.h"
+#include "path.h"
+
+static int64_t difference(int64_t a, int64_t b)
+{
+    return a > b ? a - b : b - a;
+}
+
+static int64_t manhattan(const grid_t *grid, int64_t idx1, int64_t idx2)
+{
+    const int64_t col_count = grid->col_count;
+
+    return difference(idx1 / col_count, idx2 / col_count) + difference(idx1 % col_count, idx2 % col_count);
+}
+
+int64_t a_star(const uint8_t *input, int64_t *path, int64_t row_count, int64_t col_count,
+               int64_t start, int64_t end)
+{
+    const grid_t grid = {row_count, col_count};
+    const int64_t size = row_count * col_count;
+
+    int64_t *parent = malloc(size * sizeof(int64_t));
+    int64_t *cost = malloc(size * sizeof(int64_t));
+    for (int64_t idx = 0; idx < size; ++idx)
+    {
+        parent[idx] = -1;
+        cost[idx] = -1;
+    }
+
+    int64_t length = 0;
+
+    heap_t *heap = heap_new(row_count + col_count);
+    parent[start] = start;
+    cost[start] = 0;
+    heap_push(heap, manhattan(&grid, start, end), start);
+    while (!heap_empty(heap))
+    {
+        const heap_item_t item = heap_pop(heap);
+        const int64_t idx = item.idx;
+        if (item.key > cost[idx] + manhattan(&grid, idx, end))  /* Skip outdated item */
+            continue;
+
+        if (idx == end)
+        {
+            length = trace_path(parent, start, end, path);
+            break;
+        }
+
+        for (int i = 0; i < 4; ++i)
+        {
+            if (is_open(&grid, input, idx, i))
+            {
+                const int64_t tidx = neighbour(&grid, idx, i);
+                const int64_t tcost = cost[idx] + 1;
+                if (cost[tidx] == -1 || tcost < cost[tidx])
+                {
+                    parent[tidx] = idx;
+                    cost[tidx] = tcost;
+                    heap_push(heap, tcost + manhattan(&grid, tidx, end), tidx);
+                }
+            }
+        }
+    }
+    heap_free(heap);
+    free(cost);
+    free(parent);
+
+    return length;
+}
@@ -0,0 +1,9 @@
+#ifndef A_STAR_H
+#define A_STAR_H
+
+#include <stdint.h>
+
+int64_t a_star(const uint8_t *input, int64_t *path, int64_t row_count, int64_t col_count,
+               int64_t start, int64_t end);
+
+#endif /* A_STAR_H */
@@ -0,0 +1,143 @@
+#include "bidirectional_search.h"
+
+#include <stdlib.h>
+
+#include "directions.h"
+
+#define UNVISITED 0
+#define FROM_START 1
+#define FROM_END 2
+
+/* The searches share one queue, the search from start fills it from the front and the one from end from the back */
+typedef struct search_s
+{
+    int64_t head;
+    int64_t tail;
+    int64_t step;
+    uint8_t side;
+} search_t;
+
+typedef struct context_s
+{
+    grid_t grid;
+    const uint8_t *maze;
+    int64_t *parent;
+    uint8_t *side;
+    int64_t *queue;
+} context_t;
+
+static int64_t frontier_size(const search_t *search)
+{
+    return (search->tail - search->head) * search->step;
+}
+
+static void push(context_t *ctx, search_t *search, int64_t idx)
+{
+    ctx->queue[search->tail] = idx;
+    search->tail += search->step;
+}
+
+/* Expands one level of a search and returns the cell of the other search it meets or -1 */
+static int64_t expand(context_t *ctx, search_t *search, int64_t *meet)
+{
+    for (int64_t count = frontier_size(search); count > 0; --count)
+    {
+        const int64_t idx = ctx->queue[search->head];
+        search->head += search->step;
+
+        for (int i = 0; i < 4; ++i)
+        {
+            if (is_open(&ctx->grid, ctx->maze, idx, i))
+            {
+                const int64_t tidx = neighbour(&ctx->grid, idx, i);
+                if (ctx->side[tidx] == UNVISITED)
+                {
+                    ctx->side[tidx] = search->side;
+                    ctx->parent[tidx] = idx;
+                    push(ctx, search, tidx);
+                }
+                else if (ctx->side[tidx] != search->side)
+                {
+                    *meet = idx;
+                    return tidx;
+                }
+            }
+        }
+    }
+    return -1;
+}
+
+/* Joins the path from start to a cell with the path from its neighbour to end */
+static int64_t join_path(const int64_t *parent, int64_t from_start, int64_t from_end, int64_t *path)
+{
+    int64_t length = 0;
+    for (int64_t idx = from_start; idx != -1; idx = parent[idx])
+        ++length;
+
+    int64_t i = length;
+    for (int64_t idx = from_start; idx != -1; idx = parent[idx])
+        path[--i] = idx;
+    for (int64_t idx = from_end; idx != -1; idx = parent[idx])
+        path[length++] = idx;
+
+    return length;
+}
+
+int64_t bidirectional_search(const uint8_t *input, int64_t *path, int64_t row_count, int64_t col_count,
+                             int64_t start, int64_t end)
+{
+    const int64_t size = row_count * col_count;
+
+    if (start == end)
+    {
+        path[0] = start;
+        return 1;
+    }
+
+    context_t ctx = {{row_count, col_count}};
+    ctx.maze = input;
+    ctx.parent = malloc(size * sizeof(int64_t));
+    ctx.side = calloc(size, sizeof(uint8_t));
+    ctx.queue = malloc(size * sizeof(int64_t));
+
+    search_t from_start = {0, 0, 1, FROM_START};
+    search_t from_end = {size - 1, size - 1, -1, FROM_END};
+
+    ctx.parent[start] = -1;
+    ctx.side[start] = FROM_START;
+    push(&ctx, &from_start, start);
+
+    ctx.parent[end] = -1;
+    ctx.side[end] = FROM_END;
+    push(&ctx, &from_end, end);
+
+    int64_t length = 0;
+    while (frontier_size(&from_start) > 0 && frontier_size(&from_end) > 0)
+    {
+        /* Expand the smaller frontier */
+        int64_t meet;
+        if (frontier_size(&from_start) <= frontier_size(&from_end))
+        {
+            const int64_t other = expand(&ctx, &from_start, &meet);
+            if (other != -1)
+            {
+                length = join_path(ctx.parent, meet, other, path);
+                break;
+            }
+        }
+        else
+        {
+            const int64_t other = expand(&ctx, &from_end, &meet);
+            if (other != -1)
+            {
+                length = join_path(ctx.parent, other, meet, path);
+                break;
+            }
+        }
+    }
+    free(ctx.queue);
+    free(ctx.side);
+    free(ctx.parent);
+
+    return length;
+}
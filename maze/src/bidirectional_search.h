@@ -0,0 +1,9 @@
+#ifndef BIDIRECTIONAL_SEARCH_H
+#define BIDIRECTIONAL_SEARCH_H
+
+#include <stdint.h>
+
+int64_t bidirectional_search(const uint8_t *input, int64_t *path, int64_t row_count, int64_t col_count,
+                             int64_t start, int64_t end);
+
+#endif /* BIDIRECTIONAL_SEARCH_H */
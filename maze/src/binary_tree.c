@@ -0,0 +1,27 @@
+#include "binary_tree.h"
+
+#include "directions.h"
+#include "random.h"
+
+void binary_tree(uint8_t *input, int64_t row_count, int64_t col_count, uint64_t seed)
+{
+    random_t random;
+    random_seed(&random, seed);
+
+    for (int64_t row = 0; row < row_count; ++row)
+    {
+        uint8_t *cells = input + row * col_count;
+        for (int64_t col = 0; col < col_count; ++col)
+        {
+            const bool last_row = row == row_count - 1;
+            const bool last_col = col == col_count - 1;
+
+            if (last_row && last_col)
+                continue;
+            if (last_row || (!last_col && random_bit(&random)))
+                cells[col] |= EAST;
+            else
+                cells[col] |= SOUTH;
+        }
+    }
+}
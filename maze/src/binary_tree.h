@@ -0,0 +1,8 @@
+#ifndef BINARY_TREE_H
+#define BINARY_TREE_H
+
+#include <stdint.h>
+
+void binary_tree(uint8_t *input, int64_t row_count, int64_t col_count, uint64_t seed);
+
+#endif /* BINARY_TREE_H */
@@ -0,0 +1,53 @@
+#include "breadth_first_search.h"
+
+#include <stdlib.h>
+
+#include "directions.h"
+#include "path.h"
+
+int64_t breadth_first_search(const uint8_t *input, int64_t *path, int64_t row_count, int64_t col_count,
+                             int64_t start, int64_t end)
+{
+    const grid_t grid = {row_count, col_count};
+    const int64_t size = row_count * col_count;
+
+    int64_t *parent = malloc(size * sizeof(int64_t));
+    for (int64_t idx = 0; idx < size; ++idx)
+        parent[idx] = -1;
+
+    /* Every cell is queued once, so the queue never wraps */
+    int64_t *queue = malloc(size * sizeof(int64_t));
+    int64_t head = 0;
+    int64_t tail = 0;
+
+    int64_t length = 0;
+
+    parent[start] = start;
+    queue[tail++] = start;
+    while (head < tail)
+    {
+        const int64_t idx = queue[head++];
+        if (idx == end)
+        {
+            length = trace_path(parent, start, end, path);
+            break;
+        }
+
+        for (int i = 0; i < 4; ++i)
+        {
+            if (is_open(&grid, input, idx, i))
+            {
+                const int64_t tidx = neighbour(&grid, idx, i);
+                if (parent[tidx] == -1)
+                {
+                    parent[tidx] = idx;
+                    queue[tail++] = tidx;
+                }
+            }
+        }
+    }
+    free(queue);
+    free(parent);
+
+    return length;
+}
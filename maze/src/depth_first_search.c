@@ -6,83 +6,68 @@
 #include "directions.h"
 #include "stack.h"
 
-uint8_t *maze;
-dir_t *dir_one;
-dir_t *dir_two;
-int col_count_with_walls;
+typedef struct context_s
+{
+    grid_t grid;
+    const uint8_t *maze;
+    bool *visited;
+} context_t;
 
-static int walk(int idx)
+static int64_t walk(context_t *ctx, int64_t idx)
 {
     for (int i = 0; i < 4; ++i)
     {
-        const int idx1 = dir_one[i](idx);
-        if (maze[idx1] == 255)
+        if (is_open(&ctx->grid, ctx->maze, idx, i))
         {
-            const int idx2 = dir_two[i](idx);
-            maze[idx1] = maze[idx2] = 0;
+            const int64_t tidx = neighbour(&ctx->grid, idx, i);
+            if (!ctx->visited[tidx])
+            {
+                ctx->visited[tidx] = true;
 
-            return idx2;
+                return tidx;
+            }
         }
     }
     return -1;
 }
 
-static int backtrack(stack_t *stack)
+static int64_t backtrack(context_t *ctx, stack_t *stack)
 {
     while (!stack_empty(stack))
     {
-        const int idx = stack_pop(stack);
+        const int64_t idx = stack_pop(stack);
         for (int i = 0; i < 4; ++i)
         {
-            const int tidx = dir_one[i](idx);
-            if (maze[tidx] == 255)
+            if (is_open(&ctx->grid, ctx->maze, idx, i) && !ctx->visited[neighbour(&ctx->grid, idx, i)])
                 return idx;
         }
     }
     return -1;
 }
 
-static void color(uint8_t *output, int idx, int iteration, float offset)
-{
-    const int clr = (int)iteration * offset;
-    
-    output[idx] = 255 - clr;
-    output[idx + 1] = 0;
-    output[idx + 2] = clr;
-}
-
-static void draw_path(stack_t *stack, uint8_t *output)
+static int64_t copy_path(stack_t *stack, int64_t *path)
 {
-    const int total = 2 * stack_size(stack);
-    const float offset =  (float)255 / (float)total;
+    const int64_t size = stack_size(stack);
 
-    int idx1 = stack_pop(stack);
-    color(output, 3 * idx1, 0, offset);
+    for (int64_t i = size - 1; i >= 0; --i)
+        path[i] = stack_pop(stack);
 
-    for (int i = 2; i < total; i += 2)
-    {
-        const int idx2 = stack_pop(stack);
-        const int idx3 = (idx1 + idx2) / 2;
-        color(output, 3 * idx2, i, offset);
-        color(output, 3 * idx3, i - 1, offset);
-        idx1 = idx2;
-    }
+    return size;
 }
 
-void depth_first_search(uint8_t *input, uint8_t *output, int col_count, int start, int end)
+int64_t depth_first_search(const uint8_t *input, int64_t *path, int64_t row_count, int64_t col_count,
+                           int64_t start, int64_t end)
 {
-    col_count_with_walls = 2 * col_count + 1;
+    context_t ctx = {{row_count, col_count}};
 
-    init(col_count_with_walls);
-    dir_one = get_dir_one();
-    dir_two = get_dir_two();
+    int64_t idx = start;
+    int64_t length = 0;
 
-    int idx = start;
+    ctx.maze = input;
+    ctx.visited = calloc(row_count * col_count, sizeof(bool));
+    ctx.visited[idx] = true;
 
-    maze = input;
-    maze[idx] = 0;
-
-    stack_t *stack = stack_new();
+    stack_t *stack = stack_new(row_count + col_count);
     while (idx != -1)
     {
         while (idx != -1)
@@ -90,14 +75,15 @@ void depth_first_search(uint8_t *input, uint8_t *output, int col_count, int star
             stack_push(stack, idx);
             if (idx == end)
             {
-                draw_path(stack, output);
+                length = copy_path(stack, path);
                 break;
             }
-            idx = walk(idx);
+            idx = walk(&ctx, idx);
         }
-        idx = backtrack(stack);
+        idx = backtrack(&ctx, stack);
     }
     stack_free(stack);
-    free(dir_one);
-    free(dir_two);
+    free(ctx.visited);
+
+    return length;
 }
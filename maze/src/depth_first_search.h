@@ -3,6 +3,7 @@
 
 #include <stdint.h>
 
-void depth_first_search(uint8_t *input, uint8_t *output, int col_count, int start, int end);
+int64_t depth_first_search(const uint8_t *input, int64_t *path, int64_t row_count, int64_t col_count,
+                           int64_t start, int64_t end);
 
 #endif /* DEPTH_FIRST_SEARCH_H */
@@ -1,41 +1,53 @@
 #include "directions.h"
 
-#include <stdlib.h>
-
-int g_width;
-
-void init(int width)
+int64_t neighbour(const grid_t *grid, int64_t idx, int dir)
 {
-    g_width = width;
+    switch (dir)
+    {
+    case 0:  /* North */
+        return idx >= grid->col_count ? idx - grid->col_count : -1;
+    case 1:  /* South */
+        return idx < (grid->row_count - 1) * grid->col_count ? idx + grid->col_count : -1;
+    case 2:  /* East */
+        return idx % grid->col_count != grid->col_count - 1 ? idx + 1 : -1;
+    default:  /* West */
+        return idx % grid->col_count != 0 ? idx - 1 : -1;
+    }
 }
 
-int n1(int idx) {return idx - g_width;}
-int s1(int idx) {return idx + g_width;}
-int e1(int idx) {return idx + 1;}
-int w1(int idx) {return idx - 1;}
-int n2(int idx) {return idx - 2 * g_width;}
-int s2(int idx) {return idx + 2 * g_width;}
-int e2(int idx) {return idx + 2;}
-int w2(int idx) {return idx - 2;}
-
-dir_t *get_dir_one(void)
+void carve(const grid_t *grid, uint8_t *maze, int64_t idx, int dir)
 {
-    dir_t *dir = malloc(4 * sizeof(dir_t));
-    dir[0] = n1;
-    dir[1] = s1;
-    dir[2] = e1;
-    dir[3] = w1;
-
-    return dir;
+    switch (dir)
+    {
+    case 0:
+        maze[idx - grid->col_count] |= SOUTH;
+        break;
+    case 1:
+        maze[idx] |= SOUTH;
+        break;
+    case 2:
+        maze[idx] |= EAST;
+        break;
+    default:
+        maze[idx - 1] |= EAST;
+        break;
+    }
 }
 
-dir_t *get_dir_two(void)
+bool is_open(const grid_t *grid, const uint8_t *maze, int64_t idx, int dir)
 {
-    dir_t *dir = malloc(4 * sizeof(dir_t));
-    dir[0] = n2;
-    dir[1] = s2;
-    dir[2] = e2;
-    dir[3] = w2;
-
-    return dir;
+    if (neighbour(grid, idx, dir) == -1)
+        return false;
+
+    switch (dir)
+    {
+    case 0:
+        return maze[idx - grid->col_count] & SOUTH;
+    case 1:
+        return maze[idx] & SOUTH;
+    case 2:
+        return maze[idx] & EAST;
+    default:
+        return maze[idx - 1] & EAST;
+    }
 }
@@ -1,20 +1,20 @@
 #ifndef DIRECTIONS_H
 #define DIRECTIONS_H
 
-typedef int (*dir_t)(int);
+#include <stdbool.h>
+#include <stdint.h>
 
-int n1(int idx);
-int s1(int idx);
-int e1(int idx);
-int w1(int idx);
-int n2(int idx);
-int s2(int idx);
-int e2(int idx);
-int w2(int idx);
+#define SOUTH 1  /* Cell has a passage to the cell below */
+#define EAST 2  /* Cell has a passage to the cell on the right */
 
-void init(int width);
+typedef struct grid_s
+{
+    int64_t row_count;
+    int64_t col_count;
+} grid_t;
 
-dir_t *get_dir_one(void);
-dir_t *get_dir_two(void);
+int64_t neighbour(const grid_t *grid, int64_t idx, int dir);
+void carve(const grid_t *grid, uint8_t *maze, int64_t idx, int dir);
+bool is_open(const grid_t *grid, const uint8_t *maze, int64_t idx, int dir);
 
 #endif /* DIRECTIONS_H */
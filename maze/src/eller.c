@@ -0,0 +1,135 @@
+#include "eller.h"
+
+#include <stdlib.h>
+
+#include "directions.h"
+#include "random.h"
+
+/*
+ * Sets of a row are labels in [0, 2 * col_count). Labels below col_count are
+ * carried down from the previous row, others are new sets of unlinked cells.
+ */
+typedef struct context_s
+{
+    random_t random;
+    int64_t col_count;
+    int64_t *labels;
+    int64_t *parent;
+    int64_t *count;
+    int64_t *chosen;
+    int64_t *remap;
+} context_t;
+
+static int64_t find(context_t *ctx, int64_t label)
+{
+    int64_t *parent = ctx->parent;
+    while (parent[label] != label)
+    {
+        parent[label] = parent[parent[label]];
+        label = parent[label];
+    }
+    return label;
+}
+
+static void link_row(context_t *ctx, uint8_t *cells, bool last)
+{
+    for (int64_t col = 0; col < ctx->col_count - 1; ++col)
+    {
+        const int64_t root1 = find(ctx, ctx->labels[col]);
+        const int64_t root2 = find(ctx, ctx->labels[col + 1]);
+        if (root1 != root2 && (last || random_bit(&ctx->random)))
+        {
+            ctx->parent[root2] = root1;
+            cells[col] |= EAST;
+        }
+    }
+}
+
+static void link_down(context_t *ctx, uint8_t *cells)
+{
+    const int64_t col_count = ctx->col_count;
+    int64_t *labels = ctx->labels;
+    int64_t *count = ctx->count;
+
+    /* Link cells randomly and sample one candidate per set */
+    for (int64_t col = 0; col < col_count; ++col)
+    {
+        const int64_t root = find(ctx, labels[col]);
+        labels[col] = root;
+        if (random_bit(&ctx->random))
+        {
+            cells[col] |= SOUTH;
+            count[root] = -1;
+        }
+        else if (count[root] >= 0 && random_range(&ctx->random, ++count[root]) == 0)
+        {
+            ctx->chosen[root] = col;
+        }
+    }
+
+    /* Link sampled candidate of sets without link */
+    for (int64_t col = 0; col < col_count; ++col)
+    {
+        const int64_t root = labels[col];
+        if (count[root] > 0)
+        {
+            cells[ctx->chosen[root]] |= SOUTH;
+            count[root] = -1;
+        }
+    }
+
+    /* Carry sets down and compact their labels */
+    int64_t next = 0;
+    for (int64_t col = 0; col < col_count; ++col)
+    {
+        const int64_t root = labels[col];
+        if (cells[col] & SOUTH)
+        {
+            if (ctx->remap[root] == -1)
+                ctx->remap[root] = next++;
+            labels[col] = ctx->remap[root];
+        }
+        else
+        {
+            labels[col] = col_count + col;
+        }
+    }
+}
+
+void eller(uint8_t *input, int64_t row_count, int64_t col_count, uint64_t seed)
+{
+    context_t ctx;
+    random_seed(&ctx.random, seed);
+
+    ctx.col_count = col_count;
+    ctx.labels = malloc(col_count * sizeof(int64_t));
+    ctx.parent = malloc(2 * col_count * sizeof(int64_t));
+    ctx.count = malloc(2 * col_count * sizeof(int64_t));
+    ctx.chosen = malloc(2 * col_count * sizeof(int64_t));
+    ctx.remap = malloc(2 * col_count * sizeof(int64_t));
+
+    for (int64_t col = 0; col < col_count; ++col)
+        ctx.labels[col] = col_count + col;
+
+    for (int64_t row = 0; row < row_count; ++row)
+    {
+        uint8_t *cells = input + row * col_count;
+        const bool last = row == row_count - 1;
+
+        for (int64_t label = 0; label < 2 * col_count; ++label)
+        {
+            ctx.parent[label] = label;
+            ctx.count[label] = 0;
+            ctx.remap[label] = -1;
+        }
+
+        link_row(&ctx, cells, last);
+        if (!last)
+            link_down(&ctx, cells);
+    }
+    free(ctx.remap);
+    free(ctx.chosen);
+    free(ctx.count);
+    free(ctx.parent);
+    free(ctx.labels);
+}
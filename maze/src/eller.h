@@ -0,0 +1,8 @@
+#ifndef ELLER_H
+#define ELLER_H
+
+#include <stdint.h>
+
+void eller(uint8_t *input, int64_t row_count, int64_t col_count, uint64_t seed);
+
+#endif /* ELLER_H */
@@ -0,0 +1,68 @@
+#include "heap.h"
+
+#include <stdlib.h>
+
+heap_t *heap_new(int64_t capacity)
+{
+    heap_t *heap = malloc(sizeof(heap_t));
+    heap->capacity = capacity > 0 ? capacity : 1;
+    heap->items = malloc(heap->capacity * sizeof(heap_item_t));
+    heap->size = 0;
+
+    return heap;
+}
+
+void heap_free(heap_t *heap)
+{
+    free(heap->items);
+    free(heap);
+}
+
+bool heap_empty(heap_t *heap)
+{
+    return heap->size == 0;
+}
+
+void heap_push(heap_t *heap, int64_t key, int64_t idx)
+{
+    if (heap->size == heap->capacity)
+    {
+        heap->capacity *= 2;
+        heap->items = realloc(heap->items, heap->capacity * sizeof(heap_item_t));
+    }
+
+    int64_t i = heap->size++;
+    while (i > 0)
+    {
+        const int64_t parent = (i - 1) / 2;
+        if (heap->items[parent].key <= key)
+            break;
+
+        heap->items[i] = heap->items[parent];
+        i = parent;
+    }
+    heap->items[i].key = key;
+    heap->items[i].idx = idx;
+}
+
+heap_item_t heap_pop(heap_t *heap)
+{
+    const heap_item_t top = heap->items[0];
+    const heap_item_t last = heap->items[--heap->size];
+
+    int64_t i = 0;
+    while (2 * i + 1 < heap->size)
+    {
+        int64_t child = 2 * i + 1;
+        if (child + 1 < heap->size && heap->items[child + 1].key < heap->items[child].key)
+            ++child;
+        if (last.key <= heap->items[child].key)
+            break;
+
+        heap->items[i] = heap->items[child];
+        i = child;
+    }
+    heap->items[i] = last;
+
+    return top;
+}
@@ -0,0 +1,26 @@
+#ifndef HEAP_H
+#define HEAP_H
+
+#include <stdbool.h>
+#include <stdint.h>
+
+typedef struct heap_item_s
+{
+    int64_t key;
+    int64_t idx;
+} heap_item_t;
+
+typedef struct heap_s
+{
+    heap_item_t *items;
+    int64_t size;
+    int64_t capacity;
+} heap_t;
+
+heap_t *heap_new(int64_t capacity);
+void heap_free(heap_t *heap);
+bool heap_empty(heap_t *heap);
+void heap_push(heap_t *heap, int64_t key, int64_t idx);
+heap_item_t heap_pop(heap_t *heap);
+
+#endif /* HEAP_H */
@@ -0,0 +1,141 @@
+#include "hunt_and_kill.h"
+
+#include <stdbool.h>
+#include <stdlib.h>
+
+#include "directions.h"
+#include "shuffle.h"
+
+#define UNVISITED 0
+#define BORDERED 1  /* Unvisited cell with visited neighbour */
+#define VISITED 2
+
+typedef struct context_s
+{
+    grid_t grid;
+    random_t random;
+    uint8_t *maze;
+    uint8_t *state;
+    int64_t *unvisited;
+    int64_t *bordered;
+    int range[4];
+    int64_t row;
+    int64_t col;
+} context_t;
+
+static void visit(context_t *ctx, int64_t idx)
+{
+    const int64_t row = idx / ctx->grid.col_count;
+    if (ctx->state[idx] == BORDERED)
+        --ctx->bordered[row];
+    --ctx->unvisited[row];
+    ctx->state[idx] = VISITED;
+
+    for (int i = 0; i < 4; ++i)
+    {
+        const int64_t tidx = neighbour(&ctx->grid, idx, i);
+        if (tidx != -1 && ctx->state[tidx] == UNVISITED)
+        {
+            ctx->state[tidx] = BORDERED;
+            ++ctx->bordered[tidx / ctx->grid.col_count];
+        }
+    }
+}
+
+static int64_t walk(context_t *ctx, int64_t idx)
+{
+    shuffle(&ctx->random, ctx->range);
+
+    for (int i = 0; i < 4; ++i)
+    {
+        const int j = ctx->range[i];
+        const int64_t tidx = neighbour(&ctx->grid, idx, j);
+        if (tidx != -1 && ctx->state[tidx] != VISITED)
+        {
+            carve(&ctx->grid, ctx->maze, idx, j);
+            visit(ctx, tidx);
+
+            return tidx;
+        }
+    }
+    return -1;
+}
+
+static void connect(context_t *ctx, int64_t idx)
+{
+    shuffle(&ctx->random, ctx->range);
+
+    for (int i = 0; i < 4; ++i)
+    {
+        const int j = ctx->range[i];
+        const int64_t tidx = neighbour(&ctx->grid, idx, j);
+        if (tidx != -1 && ctx->state[tidx] == VISITED)
+        {
+            carve(&ctx->grid, ctx->maze, idx, j);
+            break;
+        }
+    }
+    visit(ctx, idx);
+}
+
+static int64_t hunt(context_t *ctx)
+{
+    const int64_t row_count = ctx->grid.row_count;
+    const int64_t col_count = ctx->grid.col_count;
+
+    while (ctx->row < row_count && ctx->unvisited[ctx->row] == 0)
+    {
+        ++ctx->row;
+        ctx->col = 0;
+    }
+
+    for (int64_t row = ctx->row; row < row_count; ++row)
+    {
+        if (ctx->bordered[row] == 0)
+            continue;
+
+        /* Cells before the cursor of the first unfinished row are visited */
+        if (row == ctx->row)
+        {
+            while (ctx->state[row * col_count + ctx->col] == VISITED)
+                ++ctx->col;
+        }
+
+        const int64_t begin = row == ctx->row ? ctx->col : 0;
+        for (int64_t idx = row * col_count + begin; idx < (row + 1) * col_count; ++idx)
+        {
+            if (ctx->state[idx] == BORDERED)
+            {
+                connect(ctx, idx);
+                return idx;
+            }
+        }
+    }
+    return -1;
+}
+
+void hunt_and_kill(uint8_t *input, int64_t row_count, int64_t col_count, int64_t idx, uint64_t seed)
+{
+    context_t ctx = {{row_count, col_count}};
+    random_seed(&ctx.random, seed);
+    for (int i = 0; i < 4; ++i)
+        ctx.range[i] = i;
+
+    ctx.maze = input;
+    ctx.state = calloc(row_count * col_count, sizeof(uint8_t));
+    ctx.unvisited = malloc(row_count * sizeof(int64_t));
+    ctx.bordered = calloc(row_count, sizeof(int64_t));
+    for (int64_t row = 0; row < row_count; ++row)
+        ctx.unvisited[row] = col_count;
+
+    visit(&ctx, idx);
+    while (idx != -1)
+    {
+        while (idx != -1)
+            idx = walk(&ctx, idx);
+        idx = hunt(&ctx);
+    }
+    free(ctx.bordered);
+    free(ctx.unvisited);
+    free(ctx.state);
+}
@@ -0,0 +1,8 @@
+#ifndef HUNT_AND_KILL_H
+#define HUNT_AND_KILL_H
+
+#include <stdint.h>
+
+void hunt_and_kill(uint8_t *input, int64_t row_count, int64_t col_count, int64_t idx, uint64_t seed);
+
+#endif /* HUNT_AND_KILL_H */
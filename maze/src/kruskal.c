@@ -0,0 +1,98 @@
+#include "kruskal.h"
+
+#include <stdlib.h>
+
+#include "directions.h"
+#include "random.h"
+
+typedef struct forest_s
+{
+    int64_t *parent;
+    uint8_t *rank;
+} forest_t;
+
+static int64_t find(forest_t *forest, int64_t idx)
+{
+    int64_t *parent = forest->parent;
+    while (parent[idx] != idx)
+    {
+        parent[idx] = parent[parent[idx]];
+        idx = parent[idx];
+    }
+    return idx;
+}
+
+static bool unite(forest_t *forest, int64_t idx1, int64_t idx2)
+{
+    int64_t root1 = find(forest, idx1);
+    int64_t root2 = find(forest, idx2);
+    if (root1 == root2)
+        return false;
+
+    if (forest->rank[root1] < forest->rank[root2])
+    {
+        const int64_t t = root1;
+        root1 = root2;
+        root2 = t;
+    }
+    forest->parent[root2] = root1;
+    if (forest->rank[root1] == forest->rank[root2])
+        ++forest->rank[root1];
+
+    return true;
+}
+
+void kruskal(uint8_t *input, int64_t row_count, int64_t col_count, uint64_t seed)
+{
+    random_t random;
+    random_seed(&random, seed);
+
+    const int64_t size = row_count * col_count;
+
+    /* Edges are cell indices with direction bit, 0 is south and 1 is east */
+    int64_t *edges = malloc(2 * size * sizeof(int64_t));
+    int64_t edge_count = 0;
+    for (int64_t idx = 0; idx < size; ++idx)
+    {
+        if (idx < size - col_count)
+            edges[edge_count++] = 2 * idx;
+        if (idx % col_count != col_count - 1)
+            edges[edge_count++] = 2 * idx + 1;
+    }
+
+    forest_t forest;
+    forest.parent = malloc(size * sizeof(int64_t));
+    forest.rank = calloc(size, sizeof(uint8_t));
+    for (int64_t idx = 0; idx < size; ++idx)
+        forest.parent[idx] = idx;
+
+    int64_t links = 0;
+    for (int64_t i = edge_count - 1; i >= 0 && links < size - 1; --i)
+    {
+        /* Shuffle lazily while taking edges */
+        const int64_t j = random_range(&random, i + 1);
+        const int64_t edge = edges[j];
+        edges[j] = edges[i];
+
+        const int64_t idx = edge >> 1;
+        if (edge & 1)
+        {
+            if (unite(&forest, idx, idx + 1))
+            {
+                input[idx] |= EAST;
+                ++links;
+            }
+        }
+        else
+        {
+            if (unite(&forest, idx, idx + col_count))
+            {
+                input[idx] |= SOUTH;
+                ++links;
+            }
+        }
+    }
+    free(forest.rank);
+    free(forest.parent);
+    free(edges);
+}
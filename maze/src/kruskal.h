@@ -0,0 +1,8 @@
+#ifndef KRUSKAL_H
+#define KRUSKAL_H
+
+#include <stdint.h>
+
+void kruskal(uint8_t *input, int64_t row_count, int64_t col_count, uint64_t seed);
+
+#endif /* KRUSKAL_H */
@@ -0,0 +1,15 @@
+#include "path.h"
+
+int64_t trace_path(const int64_t *parent, int64_t start, int64_t end, int64_t *path)
+{
+    int64_t length = 1;
+    for (int64_t idx = end; idx != start; idx = parent[idx])
+        ++length;
+
+    int64_t i = length;
+    for (int64_t idx = end; idx != start; idx = parent[idx])
+        path[--i] = idx;
+    path[0] = start;
+
+    return length;
+}
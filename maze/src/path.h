@@ -0,0 +1,8 @@
+#ifndef PATH_H
+#define PATH_H
+
+#include <stdint.h>
+
+int64_t trace_path(const int64_t *parent, int64_t start, int64_t end, int64_t *path);
+
+#endif /* PATH_H */
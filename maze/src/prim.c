@@ -0,0 +1,79 @@
+#include "prim.h"
+
+#include <stdlib.h>
+
+#include "directions.h"
+#include "shuffle.h"
+
+#define UNVISITED 0
+#define FRONTIER 1
+#define VISITED 2
+
+typedef struct context_s
+{
+    grid_t grid;
+    random_t random;
+    uint8_t *maze;
+    uint8_t *state;
+    int64_t *frontier;
+    int64_t frontier_size;
+    int range[4];
+} context_t;
+
+static void add_frontier(context_t *ctx, int64_t idx)
+{
+    for (int i = 0; i < 4; ++i)
+    {
+        const int64_t tidx = neighbour(&ctx->grid, idx, i);
+        if (tidx != -1 && ctx->state[tidx] == UNVISITED)
+        {
+            ctx->state[tidx] = FRONTIER;
+            ctx->frontier[ctx->frontier_size++] = tidx;
+        }
+    }
+}
+
+static void connect(context_t *ctx, int64_t idx)
+{
+    shuffle(&ctx->random, ctx->range);
+
+    for (int i = 0; i < 4; ++i)
+    {
+        const int j = ctx->range[i];
+        const int64_t tidx = neighbour(&ctx->grid, idx, j);
+        if (tidx != -1 && ctx->state[tidx] == VISITED)
+        {
+            carve(&ctx->grid, ctx->maze, idx, j);
+            break;
+        }
+    }
+    ctx->state[idx] = VISITED;
+}
+
+void prim(uint8_t *input, int64_t row_count, int64_t col_count, int64_t idx, uint64_t seed)
+{
+    context_t ctx = {{row_count, col_count}};
+    random_seed(&ctx.random, seed);
+    for (int i = 0; i < 4; ++i)
+        ctx.range[i] = i;
+
+    ctx.maze = input;
+    ctx.state = calloc(row_count * col_count, sizeof(uint8_t));
+    ctx.frontier = malloc(row_count * col_count * sizeof(int64_t));
+    ctx.frontier_size = 0;
+
+    ctx.state[idx] = VISITED;
+    add_frontier(&ctx, idx);
+
+    while (ctx.frontier_size > 0)
+    {
+        const int64_t i = random_range(&ctx.random, ctx.frontier_size);
+        idx = ctx.frontier[i];
+        ctx.frontier[i] = ctx.frontier[--ctx.frontier_size];
+
+        connect(&ctx, idx);
+        add_frontier(&ctx, idx);
+    }
+    free(ctx.frontier);
+    free(ctx.state);
+}
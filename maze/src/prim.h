@@ -0,0 +1,8 @@
+#ifndef PRIM_H
+#define PRIM_H
+
+#include <stdint.h>
+
+void prim(uint8_t *input, int64_t row_count, int64_t col_count, int64_t idx, uint64_t seed);
+
+#endif /* PRIM_H */
@@ -0,0 +1,59 @@
+#include "random.h"
+
+/* xoshiro256** seeded with splitmix64, see https://prng.di.unimi.it */
+
+static uint64_t rotl(uint64_t x, int k)
+{
+    return (x << k) | (x >> (64 - k));
+}
+
+static uint64_t splitmix64(uint64_t *x)
+{
+    uint64_t z = (*x += 0x9E3779B97F4A7C15ULL);
+    z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9ULL;
+    z = (z ^ (z >> 27)) * 0x94D049BB133111EBULL;
+    return z ^ (z >> 31);
+}
+
+void random_seed(random_t *random, uint64_t seed)
+{
+    for (int i = 0; i < 4; ++i)
+        random->state[i] = splitmix64(&seed);
+    random->bits = 0;
+    random->bit_count = 0;
+}
+
+uint64_t random_next(random_t *random)
+{
+    uint64_t *s = random->state;
+    const uint64_t result = rotl(s[1] * 5, 7) * 9;
+    const uint64_t t = s[1] << 17;
+
+    s[2] ^= s[0];
+    s[3] ^= s[1];
+    s[1] ^= s[2];
+    s[0] ^= s[3];
+    s[2] ^= t;
+    s[3] = rotl(s[3], 45);
+
+    return result;
+}
+
+bool random_bit(random_t *random)
+{
+    if (random->bit_count == 0)
+    {
+        random->bits = random_next(random);
+        random->bit_count = 64;
+    }
+    const bool bit = random->bits & 1;
+    random->bits >>= 1;
+    --random->bit_count;
+
+    return bit;
+}
+
+int64_t random_range(random_t *random, int64_t n)
+{
+    return (int64_t)(random_next(random) % (uint64_t)n);
+}
@@ -0,0 +1,19 @@
+#ifndef RANDOM_H
+#define RANDOM_H
+
+#include <stdbool.h>
+#include <stdint.h>
+
+typedef struct random_s
+{
+    uint64_t state[4];
+    uint64_t bits;
+    int bit_count;
+} random_t;
+
+void random_seed(random_t *random, uint64_t seed);
+uint64_t random_next(random_t *random);
+bool random_bit(random_t *random);
+int64_t random_range(random_t *random, int64_t n);
+
+#endif /* RANDOM_H */
@@ -2,86 +2,75 @@
 
 #include <stdbool.h>
 #include <stdlib.h>
-#include <time.h>
 
 #include "directions.h"
 #include "shuffle.h"
 #include "stack.h"
 
-uint8_t *maze;
-dir_t *dir_one;
-dir_t *dir_two;
-int range[4] = {0, 1, 2, 3};
-int row_count_with_walls;
-int col_count_with_walls;
-int max_idx;
-
-static bool out_ouf_bounds(int idx)
+typedef struct context_s
 {
-    return idx >= max_idx || (idx % col_count_with_walls) % 2 == 0;
-}
+    grid_t grid;
+    random_t random;
+    uint8_t *maze;
+    bool *visited;
+    int range[4];
+} context_t;
 
-static int walk(int idx)
+static int64_t walk(context_t *ctx, int64_t idx)
 {
-    shuffle(range);
+    shuffle(&ctx->random, ctx->range);
 
     for (int i = 0; i < 4; ++i)
     {
-        const int j = range[i];
-        const int idx2 = dir_two[j](idx);
-        if (!out_ouf_bounds(idx2) && maze[idx2] == 0)
+        const int j = ctx->range[i];
+        const int64_t tidx = neighbour(&ctx->grid, idx, j);
+        if (tidx != -1 && !ctx->visited[tidx])
         {
-            const int idx1 = dir_one[j](idx);
-            maze[idx1] = maze[idx2] = 255;
-            
-            return idx2;
+            ctx->visited[tidx] = true;
+            carve(&ctx->grid, ctx->maze, idx, j);
+
+            return tidx;
         }
     }
     return -1;
 }
 
-static int backtrack(stack_t *stack)
+static int64_t backtrack(context_t *ctx, stack_t *stack)
 {
     while (!stack_empty(stack))
     {
-        const int idx = stack_pop(stack);
+        const int64_t idx = stack_pop(stack);
         for (int i = 0; i < 4; ++i)
         {
-            const int tidx = dir_two[i](idx);
-            if (!out_ouf_bounds(tidx) && maze[tidx] == 0)
+            const int64_t tidx = neighbour(&ctx->grid, idx, i);
+            if (tidx != -1 && !ctx->visited[tidx])
                 return idx;
         }
     }
     return -1;
 }
 
-void recursive_backtracking(uint8_t *input, int row_count, int col_count, int idx)
+void recursive_backtracking(uint8_t *input, int64_t row_count, int64_t col_count, int64_t idx, uint64_t seed)
 {
-    srand(time(NULL));
-
-    row_count_with_walls = 2 * row_count + 1;
-    col_count_with_walls = 2 * col_count + 1;
-    max_idx = row_count_with_walls * col_count_with_walls;
+    context_t ctx = {{row_count, col_count}};
+    random_seed(&ctx.random, seed);
+    for (int i = 0; i < 4; ++i)
+        ctx.range[i] = i;
 
-    init(col_count_with_walls);
-    dir_one = get_dir_one();
-    dir_two = get_dir_two();
+    ctx.maze = input;
+    ctx.visited = calloc(row_count * col_count, sizeof(bool));
+    ctx.visited[idx] = true;
 
-    maze = input;
-    maze[idx] = 255;
-    
-    stack_t *stack = stack_new();
+    stack_t *stack = stack_new(row_count + col_count);
     while (idx != -1)
     {
         while (idx != -1)
         {
             stack_push(stack, idx);
-            idx = walk(idx);
+            idx = walk(&ctx, idx);
         }
-        idx = backtrack(stack);
+        idx = backtrack(&ctx, stack);
     }
     stack_free(stack);
-    free(dir_one);
-    free(dir_two);
+    free(ctx.visited);
 }
-
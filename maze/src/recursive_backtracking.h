@@ -3,6 +3,6 @@
 
 #include <stdint.h>
 
-void recursive_backtracking(uint8_t *input, int row_count, int col_count, int idx);
+void recursive_backtracking(uint8_t *input, int64_t row_count, int64_t col_count, int64_t idx, uint64_t seed);
 
 #endif /* RECURSIVE_BACKTRACKING_H */
@@ -1,12 +1,10 @@
 #include "shuffle.h"
 
-#include <stdlib.h>
-
-void shuffle(int *array)
+void shuffle(random_t *random, int *array)
 {
     for (int i = 0; i < 3; ++i)
     {
-        const int j = i + rand() / (RAND_MAX / (4 - i) + 1);
+        const int j = i + random_range(random, 4 - i);
         const int t = array[j];
         array[j] = array[i];
         array[i] = t;
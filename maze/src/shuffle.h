@@ -1,6 +1,8 @@
 #ifndef SHUFFLE_H
 #define SHUFFLE_H
 
-void shuffle(int *array);
+#include "random.h"
+
+void shuffle(random_t *random, int *array);
 
 #endif /* SHUFFLE_H */
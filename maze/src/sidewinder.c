@@ -0,0 +1,33 @@
+#include "sidewinder.h"
+
+#include "directions.h"
+#include "random.h"
+
+void sidewinder(uint8_t *input, int64_t row_count, int64_t col_count, uint64_t seed)
+{
+    random_t random;
+    random_seed(&random, seed);
+
+    for (int64_t col = 0; col < col_count - 1; ++col)
+        input[col] |= EAST;
+
+    for (int64_t row = 1; row < row_count; ++row)
+    {
+        uint8_t *cells = input + row * col_count;
+        uint8_t *above = cells - col_count;
+
+        int64_t run_start = 0;
+        for (int64_t col = 0; col < col_count; ++col)
+        {
+            if (col == col_count - 1 || random_bit(&random))
+            {
+                above[run_start + random_range(&random, col - run_start + 1)] |= SOUTH;
+                run_start = col + 1;
+            }
+            else
+            {
+                cells[col] |= EAST;
+            }
+        }
+    }
+}
@@ -0,0 +1,8 @@
+#ifndef SIDEWINDER_H
+#define SIDEWINDER_H
+
+#include <stdint.h>
+
+void sidewinder(uint8_t *input, int64_t row_count, int64_t col_count, uint64_t seed);
+
+#endif /* SIDEWINDER_H */
@@ -2,57 +2,43 @@
 
 #include <stdlib.h>
 
-stack_t *stack_new(void)
+stack_t *stack_new(int64_t capacity)
 {
     stack_t *stack = malloc(sizeof(stack_t));
-    stack->top = NULL;
+    stack->capacity = capacity > 0 ? capacity : 1;
+    stack->items = malloc(stack->capacity * sizeof(int64_t));
+    stack->size = 0;
 
     return stack;
 }
 
-void stack_free(stack_t *stack) 
+void stack_free(stack_t *stack)
 {
-    while (stack->top != NULL) 
-    {
-        stack_frame_t *frame = stack->top;
-        stack->top = frame->next;
-        free(frame);
-    }
+    free(stack->items);
     free(stack);
 }
 
 bool stack_empty(stack_t *stack)
 {
-    return stack == NULL || stack->top == NULL;
+    return stack == NULL || stack->size == 0;
 }
 
-int stack_size(stack_t *stack)
+int64_t stack_size(stack_t *stack)
 {
-    stack_frame_t *frame = stack->top;
-    
-    int size = 0;
-    while (frame != NULL)
-    {
-        ++size;
-        frame = frame->next;
-    }
-    return size;
+    return stack->size;
 }
 
-void stack_push(stack_t *stack, int idx)
+void stack_push(stack_t *stack, int64_t idx)
 {
-    stack_frame_t *frame = malloc(sizeof(stack_frame_t));
-    frame->idx = idx;
-    frame->next = stack->top;
-    stack->top = frame;
+    if (stack->size == stack->capacity)
+    {
+        stack->capacity *= 2;
+        stack->items = realloc(stack->items, stack->capacity * sizeof(int64_t));
+    }
+    stack->items[stack->size++] = idx;
 }
 
-int stack_pop(stack_t *stack)
+int64_t stack_pop(stack_t *stack)
 {
-    stack_frame_t *frame = stack->top;
-    const int idx = frame->idx;
-    stack->top = frame->next;
-    free(frame);
-    
-    return idx;
+    return stack->items[--stack->size];
 }
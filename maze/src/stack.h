@@ -2,23 +2,20 @@
 #define STACK_H
 
 #include <stdbool.h>
-
-typedef struct stack_frame_s
-{
-    struct stack_frame_s *next;
-    int idx;
-} stack_frame_t;
+#include <stdint.h>
 
 typedef struct stack_s
 {
-    stack_frame_t *top;
+    int64_t *items;
+    int64_t size;
+    int64_t capacity;
 } stack_t;
 
-stack_t *stack_new(void);
+stack_t *stack_new(int64_t capacity);
 void stack_free(stack_t *stack);
 bool stack_empty(stack_t *stack);
-int stack_size(stack_t *stack);
-void stack_push(stack_t *stack, int idx);
-int stack_pop(stack_t *stack);
+int64_t stack_size(stack_t *stack);
+void stack_push(stack_t *stack, int64_t idx);
+int64_t stack_pop(stack_t *stack);
 
 #endif /* STACK_H */
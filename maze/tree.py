@@ -0,0 +1,294 @@
+import numpy as np
+
+import maze.utils as utils
+
+# Directions are south, north, west and east like in maze.Maze, the reverse of a direction is direction ^ 1
+
+BITS = np.array([bin(mask).count("1") for mask in range(16)], dtype=np.intp)  # Number of directions in bit masks
+CLOCKWISE = (1, 3, 0, 2)  # Directions north, east, south and west
+BLOCK = 32  # Length of blocks of the tour for lowest common ancestor queries
+
+
+def next_directions():
+    """Returns a table of the next direction clockwise for bit masks of directions and a direction."""
+    table = np.zeros((16, 4), dtype=np.intp)
+    for mask in range(16):
+        for direction in range(4):
+            position = CLOCKWISE.index(direction)
+            for step in range(1, 5):
+                candidate = CLOCKWISE[(position + step) % 4]
+                if mask >> candidate & 1:
+                    table[mask, direction] = candidate
+                    break
+
+    return table
+
+
+NEXT = next_directions()
+
+
+def openings(maze):
+    """Returns the directions of open passages of cells as flat bit masks."""
+    return utils.directions(maze & utils.SOUTH != 0, maze & utils.EAST != 0).ravel()
+
+
+def offsets(maze):
+    """Returns the offsets of flat indices of adjacent cells in directions."""
+    return np.array([maze.shape[1], -maze.shape[1], -1, 1], dtype=np.intp)
+
+
+def dead_end_filling(maze, start, end):
+    """
+    Fills the dead ends of a maze and returns a flat mask of the remaining cells.
+
+    All cells except start and end with at most one open passage are filled at once, which repeats for their neighbours
+    until no dead end is left. The remaining cells contain all paths from start to end.
+    """
+    directions = openings(maze)
+    offset = offsets(maze)
+    degree = BITS[directions]  # Number of passages to cells which are not filled
+    filled = np.zeros(maze.size, dtype=bool)
+    keep = np.zeros(maze.size, dtype=bool)
+    keep[[start, end]] = True
+
+    dead_ends = np.flatnonzero((degree <= 1) & ~keep)
+    while dead_ends.size >= 16:
+        filled[dead_ends] = True
+
+        # Remove passages to neighbours of dead ends, neighbours with one passage left are the next dead ends
+        passages = (directions[dead_ends, np.newaxis] >> np.arange(4) & 1).astype(bool)
+        neighbours = (dead_ends[:, np.newaxis] + offset)[passages]
+        neighbours = neighbours[~filled[neighbours]]
+        np.subtract.at(degree, neighbours, 1)
+        dead_ends = np.unique(neighbours[(degree[neighbours] <= 1) & ~keep[neighbours]])
+
+    # Few long dead ends are left, filling them one by one is faster than array operations for each cell
+    stack = dead_ends.tolist()
+    offset = offset.tolist()
+    while stack:
+        idx = stack.pop()
+        filled[idx] = True
+        passages = int(directions[idx])
+        for direction in range(4):
+            if passages >> direction & 1:
+                tidx = idx + offset[direction]
+                if not filled[tidx]:
+                    degree[tidx] -= 1
+                    if degree[tidx] == 1 and not keep[tidx]:  # Neighbour became a dead end
+                        stack.append(tidx)
+
+    return ~filled
+
+
+class Tree(object):
+    """This class contains the tree decomposition of a perfect maze built from an Euler tour around its walls."""
+    def __init__(self, maze, root=0):
+        """Constructor."""
+        self.maze = maze
+        self.root = root
+        self.row_count, self.col_count = maze.shape
+
+        size = maze.size
+        directions = openings(maze)
+
+        # Directed passages as flat index of cell with direction, sorted by cell [4 * idx + direction, ...]
+        edges = np.flatnonzero((directions[:, np.newaxis] >> np.arange(4) & 1).ravel())
+        if edges.size != 2 * (size - 1):
+            raise utils.MazeError("Cannot decompose maze because it is not perfect.")
+
+        index = np.zeros(4 * size, dtype=np.intp)  # Index of passages in edges
+        index[edges] = np.arange(edges.size)
+
+        cells = edges >> 2
+        heads = cells + offsets(maze)[edges & 3]  # Cells the passages lead to
+        backward = (edges & 3) ^ 1  # Directions back to the cells
+        reverse = index[4 * heads + backward]
+
+        # Walk around walls and leave each cell through the next passage clockwise after the one it was entered by
+        successor = index[4 * heads + NEXT[directions[heads], backward]]
+
+        position = self._rank(successor, np.searchsorted(edges, 4 * root))
+        order = np.empty(edges.size, dtype=np.intp)
+        order[position] = np.arange(edges.size)  # Passages in order of the tour
+
+        down = position < position[reverse]  # Passages away from the root are walked before their reverse
+        down_order = down[order]
+        steps = np.where(down_order, 1, -1)
+
+        # Cells and their depths in order of the tour, the tour visits a cell once more after each of its children
+        self.euler = np.concatenate(([root], heads[order]))
+        self.euler_depth = np.concatenate(([0], np.cumsum(steps)))
+
+        self.parent = np.full(size, -1, dtype=np.intp)
+        self.parent[heads[down]] = cells[down]
+        self.depth = np.zeros(size, dtype=np.intp)
+        self.depth[heads[order[down_order]]] = self.euler_depth[1:][down_order]
+
+        # First and last occurrence of cells in the tour, cells of a subtree occur between them
+        self.first = np.zeros(size, dtype=np.intp)
+        self.first[heads[order[down_order]]] = np.flatnonzero(down_order) + 1
+        self.last = np.full(size, edges.size, dtype=np.intp)
+        self.last[cells[order[~down_order]]] = np.flatnonzero(~down_order)
+
+        self._build_table()
+
+    def _build_table(self):
+        """Builds a sparse table of the positions of the lowest cells within ranges of blocks of the tour."""
+        block_count = -(-len(self.euler) // BLOCK)
+        depth = np.full(block_count * BLOCK, np.iinfo(np.intp).max, dtype=np.intp)
+        depth[:len(self.euler)] = self.euler_depth
+        lowest = np.argmin(depth.reshape((block_count, BLOCK)), axis=1) + BLOCK * np.arange(block_count)
+
+        # Level j contains the lowest positions of 2 ** j blocks starting at each block
+        self._table = [lowest]
+        width = 1
+        while 2 * width <= block_count:
+            previous = self._table[-1]
+            left = previous[:-width]
+            right = previous[width:]
+            self._table.append(np.where(self.euler_depth[left] <= self.euler_depth[right], left, right))
+            width *= 2
+
+    def _lower(self, position1, position2):
+        """Returns the positions of the lower cells of two arrays of tour positions."""
+        return np.where(self.euler_depth[position1] <= self.euler_depth[position2], position1, position2)
+
+    def _lowest_in_block(self, begin, end):
+        """Returns the positions of the lowest cells between tour positions within one block."""
+        positions = begin[:, np.newaxis] + np.arange(BLOCK)
+        positions = np.minimum(positions, end[:, np.newaxis])  # Repeat the end of shorter ranges
+        return positions[np.arange(len(begin)), np.argmin(self.euler_depth[positions], axis=1)]
+
+    def _lowest_common_ancestors(self, idx1, idx2):
+        """Returns the lowest common ancestors of arrays of flat indices, the lowest cells between them in the tour."""
+        begin = np.minimum(self.first[idx1], self.first[idx2])
+        end = np.maximum(self.first[idx1], self.first[idx2])
+        begin_block = begin // BLOCK
+        end_block = end // BLOCK
+
+        # Lowest cells in the partial blocks at both ends of the ranges
+        lowest = self._lower(
+            self._lowest_in_block(begin, np.minimum(end, BLOCK * begin_block + BLOCK - 1)),
+            self._lowest_in_block(np.maximum(begin, BLOCK * end_block), end)
+        )
+
+        # Lowest cells in the full blocks between them from two overlapping ranges of the sparse table
+        inner = end_block - begin_block > 1
+        if inner.any():
+            first_block = begin_block[inner] + 1
+            block_count = end_block[inner] - first_block
+            level = np.log2(block_count).astype(np.intp)  # Exact for block counts below 2 ** 52
+            candidates = np.empty(len(first_block), dtype=np.intp)
+            for j in np.unique(level):  # Levels are few, so each is looked up at once
+                select = level == j
+                table = self._table[j]
+                candidates[select] = self._lower(
+                    table[first_block[select]], table[first_block[select] + block_count[select] - (1 << j)]
+                )
+            lowest[inner] = self._lower(lowest[inner], candidates)
+
+        return self.euler[lowest]
+
+    @staticmethod
+    def _rank(successor, first):
+        """Returns the positions of passages in the tour which starts with the first passage."""
+        count = successor.size
+        if count == 0:
+            return successor
+
+        # Split the tour into sublists which start at every 64th passage and walk all of them at once
+        rulers = np.union1d([first], np.arange(0, count, 64))
+        ruler_index = np.full(count, -1, dtype=np.intp)
+        ruler_index[rulers] = np.arange(rulers.size)
+        owner = np.full(count, -1, dtype=np.intp)  # Sublist of passages
+        owner[rulers] = np.arange(rulers.size)
+        offset = np.zeros(count, dtype=np.intp)  # Position of passages within their sublist
+        following = np.zeros(rulers.size, dtype=np.intp)  # Sublist following a sublist
+        length = np.zeros(rulers.size, dtype=np.intp)
+
+        active = np.arange(rulers.size)
+        current = successor[rulers]
+        step = 1
+        while active.size:
+            done = ruler_index[current] != -1  # Sublists end before the next ruler
+            following[active[done]] = ruler_index[current[done]]
+            length[active[done]] = step
+            active = active[~done]
+            current = current[~done]
+            owner[current] = active
+            offset[current] = step
+            current = successor[current]
+            step += 1
+
+        # Sublists are few, so their positions are accumulated in order of the tour one by one
+        start = np.zeros(rulers.size, dtype=np.intp)
+        following = following.tolist()
+        length = length.tolist()
+        idx = ruler_index[first]
+        position = 0
+        for _ in range(rulers.size):
+            start[idx] = position
+            position += length[idx]
+            idx = following[idx]
+            if idx == ruler_index[first]:
+                break
+
+        if position != count:  # Passages which are not part of the tour belong to other sublists
+            raise utils.MazeError("Cannot decompose maze because it is not perfect.")
+
+        return start[owner] + offset
+
+    def _index(self, cells):
+        """Converts a cell or an array of cells into flat indices."""
+        cells = np.asarray(cells, dtype=np.intp)
+        x = cells[..., 0]
+        y = cells[..., 1]
+        if np.any((x < 0) | (x >= self.row_count) | (y < 0) | (y >= self.col_count)):
+            raise utils.MazeError("Cells <{}> are out of range.".format(cells.tolist()))
+
+        return x * self.col_count + y
+
+    def lowest_common_ancestor(self, cell1, cell2):
+        """Returns the lowest common ancestor of two cells, where their paths to the root meet."""
+        idx = self._lowest_common_ancestors(self._index([cell1]), self._index([cell2]))[0]
+        return divmod(int(idx), self.col_count)
+
+    def lowest_common_ancestors(self, cells1, cells2):
+        """Returns the lowest common ancestors of arrays of cells as array of cells [[x, y], ...]."""
+        idx = self._lowest_common_ancestors(self._index(cells1).reshape(-1), self._index(cells2).reshape(-1))
+        return np.column_stack(np.divmod(idx, self.col_count))
+
+    def distance(self, cell1, cell2):
+        """Returns the number of steps between two cells."""
+        return int(self.distances([cell1], [cell2])[0])
+
+    def distances(self, cells1, cells2):
+        """Returns the numbers of steps between arrays of cells."""
+        idx1 = self._index(cells1).reshape(-1)
+        idx2 = self._index(cells2).reshape(-1)
+        lowest = self._lowest_common_ancestors(idx1, idx2)
+
+        return self.depth[idx1] + self.depth[idx2] - 2 * self.depth[lowest]
+
+    def path(self, start, end):
+        """Returns the path between two cells as array of cells [[x, y], ...]."""
+        start = int(self._index(start))
+        end = int(self._index(end))
+        lowest = int(self._lowest_common_ancestors(np.array([start]), np.array([end]))[0])
+
+        # Walk up from both cells to their lowest common ancestor
+        up = [start]
+        while up[-1] != lowest:
+            up.append(int(self.parent[up[-1]]))
+        down = []
+        idx = end
+        while idx != lowest:
+            down.append(idx)
+            idx = int(self.parent[idx])
+        down.reverse()
+
+        return np.column_stack(np.divmod(np.array(up + down, dtype=np.intp), self.col_count))
+
+    def paths(self, starts, ends):
+        """Returns the paths between arrays of cells as list of arrays of cells."""
+        return [self.path(start, end) for start, end in zip(np.asarray(starts), np.asarray(ends))]
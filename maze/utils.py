@@ -1,5 +1,9 @@
 import numpy as np
 import collections
+import sys
+
+SOUTH = 1  # Cell has a passage to the cell below
+EAST = 2  # Cell has a passage to the cell on the right
 
 
 class MazeError(Exception):
@@ -9,6 +13,19 @@ class MazeError(Exception):
         super(MazeError, self).__init__(e)
 
 
+class MazeWarning(UserWarning):
+    """Maze warning class."""
+
+
+def library_name():
+    """Returns the file name of the C library for the current platform."""
+    if sys.platform == "win32":
+        return "libmaze.dll"
+    if sys.platform == "darwin":
+        return "libmaze.dylib"
+    return "libmaze.so"
+
+
 def stack_empty():
     """Creates empty spaghetti stack."""
     return ()
@@ -29,27 +46,100 @@ def stack_deque(stack):
     return deque
 
 
-def color(offset, iteration):
-    """Returns color for current iteration."""
-    clr = iteration * offset
+def set_find(parent, item):
+    """Finds the root of an item in a disjoint-set forest and compresses its path."""
+    root = item
+    while parent[root] != root:
+        root = parent[root]
+    while parent[item] != root:
+        parent[item], item = root, parent[item]
+
+    return root
+
+
+def set_union(parent, rank, item1, item2):
+    """Unites the sets of two items by rank and returns False if they already share a set."""
+    root1 = set_find(parent, item1)
+    root2 = set_find(parent, item2)
+    if root1 == root2:
+        return False
+
+    if rank[root1] < rank[root2]:
+        root1, root2 = root2, root1
+    parent[root2] = root1
+    if rank[root1] == rank[root2]:
+        rank[root1] += 1
+
+    return True
+
+
+def path_pixels(path):
+    """Returns the rows, columns and colors of the pixels of a path of cells in the image with walls."""
+    cells = 2 * np.asarray(path, dtype=np.intp).reshape((-1, 2)) + 1  # Cells in the image with walls
+    pixels = np.empty((2 * len(cells) - 1, 2), dtype=np.intp)
+    pixels[0::2] = cells
+    pixels[1::2] = (cells[:-1] + cells[1:]) // 2  # Passages between cells
+
+    clr = np.arange(len(pixels)) * (255 / (2 * len(cells)))  # Gradient from blue to red
+    colors = np.column_stack((clr, np.zeros_like(clr), 255 - clr)).astype(np.uint8)
+
+    return pixels[:, 0], pixels[:, 1], colors
+
+
+def draw_path(solution, path):
+    """Draws path of cells in solution."""
+    rows, cols, colors = path_pixels(path)
+    solution[rows, cols] = colors
+
+
+def directions(south, east):
+    """Returns the directions south, north, west and east of cells as bit masks from masks of their south and east sides."""
+    south = south.astype(np.uint8)
+    east = east.astype(np.uint8)
+    north = np.zeros_like(south)
+    north[1:] = south[:-1]
+    west = np.zeros_like(east)
+    west[:, 1:] = east[:, :-1]
+    south[-1] = 0  # Last row has no cells below
+    east[:, -1] = 0  # Last column has no cells on the right
+
+    return south | north << 1 | west << 2 | east << 3
+
+
+def to_rgb(maze):
+    """Converts maze cells into an RGB image with walls."""
+    row_count, col_count = maze.shape
+    image = np.zeros((2 * row_count + 1, 2 * col_count + 1), dtype=np.uint8)
+    image[1::2, 1::2] = 255  # Cells
+    image[2:-1:2, 1::2] = ((maze[:-1] & SOUTH) != 0) * 255  # Vertical passages
+    image[1::2, 2:-1:2] = ((maze[:, :-1] & EAST) != 0) * 255  # Horizontal passages
+
+    return image[:, :, np.newaxis].repeat(3, axis=2)
+
+
+def to_rgb_tile(maze, x, y, row_count, col_count):
+    """Converts a tile of maze cells into the according part of the RGB image with walls of the whole maze."""
+    tile = maze[x:x + row_count, y:y + col_count]  # Only reads the rows of the tile
+    image = np.zeros((2 * tile.shape[0] + 1, 2 * tile.shape[1] + 1), dtype=np.uint8)
+    image[1::2, 1::2] = 255  # Cells
+    image[2::2, 1::2] = ((tile & SOUTH) != 0) * 255  # Vertical passages, including those to cells below the tile
+    image[1::2, 2::2] = ((tile & EAST) != 0) * 255  # Horizontal passages, including those to cells right of the tile
+    if x > 0:
+        image[0, 1::2] = ((maze[x - 1, y:y + col_count] & SOUTH) != 0) * 255  # Passages to cells above the tile
+    if y > 0:
+        image[1::2, 0] = ((maze[x:x + row_count, y - 1] & EAST) != 0) * 255  # Passages to cells left of the tile
 
-    return clr, 0, 255 - clr
+    return image[:, :, np.newaxis].repeat(3, axis=2)
 
 
-def draw_path(solution, stack):
-    """Draws path in solution."""
-    total = 2 * len(stack)
-    offset = 255 / total
-    iteration = 2
+def from_rgb(image):
+    """Converts an RGB image with walls into maze cells."""
+    walls = image[:, :, 0] != 0
+    maze = np.zeros((walls.shape[0] // 2, walls.shape[1] // 2), dtype=np.uint8)
+    maze[:-1] |= walls[2:-1:2, 1::2].astype(np.uint8) * SOUTH  # Vertical passages
+    maze[:, :-1] |= walls[1::2, 2:-1:2].astype(np.uint8) * EAST  # Horizontal passages
 
-    x1, y1 = stack.popleft()
-    solution[x1, y1] = color(offset, 0)
-    while iteration < total:
-        x2, y2 = stack.popleft()
-        solution[x2, y2] = color(offset, iteration)
-        solution[(x1 + x2) // 2, (y1 + y2) // 2] = color(offset, iteration - 1)
-        x1, y1 = x2, y2
-        iteration += 2
+    return maze
 
 
 def upscale(maze, scale):
@@ -64,10 +154,22 @@ def upscale(maze, scale):
 
 def get_scale(maze):
     """Calculates scale of upscaled maze."""
-    for x in range(len(maze)):
-        for y in range(len(maze[0])):
-            if maze[x, y, 0] != 0:
-                return x
+    diagonal = np.diagonal(maze[:, :, 0]) != 0  # Diagonal passes the wall corner, first cell and next corner
+    if not diagonal.any():
+        raise MazeError("Cannot calculate scale because the image contains no cells.")
+
+    scale = int(np.argmax(diagonal))  # Length of the wall before the first cell
+    height, width = maze.shape[:2]
+    if (scale == 0 or not diagonal[scale:2 * scale].all() or diagonal[2 * scale:3 * scale].any()
+            or height % scale != 0 or width % scale != 0 or height // scale % 2 == 0 or width // scale % 2 == 0):
+        raise MazeError("Cannot calculate scale because the image is no upscaled maze.")
+
+    # Check that blocks along the first row and column of cells have the same color in their corners
+    if (not np.array_equal(maze[scale, ::scale], maze[2 * scale - 1, scale - 1::scale])
+            or not np.array_equal(maze[::scale, scale], maze[scale - 1::scale, 2 * scale - 1])):
+        raise MazeError("Cannot calculate scale because the image is no upscaled maze.")
+
+    return scale
 
 
 def downscale(maze):
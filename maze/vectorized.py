@@ -0,0 +1,107 @@
+import numpy as np
+
+import maze.utils as utils
+
+# The functions create mazes in place within C-contiguous arrays of shape (..., rows, cols) and advance all of them together
+
+
+def sidewinder(mazes, rng):
+    """Creates mazes using the sidewinder algorithm."""
+    # Create first row
+    mazes[..., 0, :-1] |= utils.EAST
+
+    # Close runs in other rows randomly, last cell of a row closes a run
+    close = rng.integers(0, 2, size=mazes[..., 1:, :].shape, dtype=bool)
+    close[..., -1] = True
+
+    # Create horizontal links within runs
+    mazes[..., 1:, :-1] |= (~close[..., :-1]).astype(np.uint8) * utils.EAST
+
+    # Create one vertical link for each run
+    run_end = np.flatnonzero(close)  # Flat index of last cell in run
+    run_start = np.concatenate(([0], run_end[:-1] + 1))  # Flat index of first cell in run
+    run_cell = run_start + (rng.random(run_end.size) * (run_end - run_start + 1)).astype(np.intp)  # Random cell in run
+    area = close.shape[-2] * close.shape[-1]
+    above = run_cell // area * (area + close.shape[-1]) + run_cell % area  # Flat index of cell above in mazes
+    mazes.reshape(-1)[above] |= utils.SOUTH  # Connect with cell above
+
+
+def binary_tree(mazes, rng):
+    """Creates mazes using the binary tree algorithm."""
+    east = rng.integers(0, 2, size=mazes.shape, dtype=bool)  # Link east or south
+    east[..., -1, :] = True  # Link east in last row
+    east[..., :, -1] = False  # Link south in last column
+
+    links = np.where(east, utils.EAST, utils.SOUTH).astype(np.uint8)
+    links[..., -1, -1] = 0  # Last cell has no link
+    mazes |= links
+
+
+def find(parent, labels, compress=True):
+    """Returns the roots of labels in a disjoint-set forest and optionally links the labels to them."""
+    roots = parent[labels]
+    while True:
+        up = parent[roots]
+        if np.array_equal(up, roots):
+            break
+        roots = up
+    if compress:
+        parent[labels] = roots
+
+    return roots
+
+
+def eller(mazes, rng):
+    """
+    Creates mazes using Eller's algorithm.
+
+    Sets are merged in a disjoint-set forest, so each row takes time linear in its cells. Cells are still processed
+    column by column, which makes it several times slower than the sidewinder and binary tree algorithm.
+    """
+    row_count, col_count = mazes.shape[-2:]
+    rows = mazes.reshape((-1, row_count, col_count))  # Flatten leading dimensions
+    count = rows.shape[0]
+
+    # Arrays of rows are transposed to (cols, mazes) to advance all mazes with contiguous columns
+    dtype = np.int32 if 2 * col_count * count < 2 ** 31 else np.intp  # Smaller labels are faster to look up
+    cols = np.arange(col_count, dtype=dtype)[:, np.newaxis]
+    keys = np.arange(count, dtype=dtype)  # Labels of all mazes are interleaved, label * count + maze
+    labels = np.repeat(col_count + cols, count, axis=1)  # Set labels, unlinked cells get new sets
+    columns = np.repeat(cols, count)  # Columns of flat labels
+
+    for x in range(row_count):
+        last = x == row_count - 1
+        labels = labels * count + keys  # Labels of all mazes in one disjoint-set forest
+        parent = np.arange(2 * col_count * count, dtype=dtype)
+
+        # Connect cells with next cells, sets are merged in the forest instead of relabeling all cells
+        east = rng.integers(0, 2, size=(col_count, count), dtype=bool)
+        east[-1] = False
+        new_index = labels[0]  # Roots of the sets of the previous cells
+        for y in range(col_count - 1):
+            old_index = find(parent, labels[y + 1])
+            merge = new_index != old_index  # Only connect cells of different sets
+            if last:
+                east[y] = merge  # Connect all different sets in last row
+            else:
+                east[y] &= merge
+            new_index = np.where(east[y], new_index, old_index)
+            parent[old_index] = new_index  # Combine both sets, other roots stay roots
+        rows[:, x] |= east.T.astype(np.uint8) * utils.EAST
+
+        if last:
+            break
+
+        # Create vertical links randomly and at least one for each set, the cell with the highest priority of a set
+        # without link is linked as well, sets with links already link that cell
+        key = find(parent, labels.ravel(), compress=False)
+        priority = rng.random(key.size)
+        best = np.zeros(parent.size)
+        np.maximum.at(best, key, priority)
+        down = ((priority >= 0.5) | (priority == best[key])).reshape((col_count, count))
+        rows[:, x] |= down.T.astype(np.uint8) * utils.SOUTH
+
+        # Carry sets down, label them with one of the columns of the set that link down
+        column = np.empty(parent.size + 1, dtype=dtype)
+        column[np.where(down.ravel(), key, parent.size)] = columns  # Cells without link write to the last label
+        labels = np.where(down, column[key].reshape((col_count, count)), col_count + cols)
@@ -1,4 +1,8 @@
+import glob
+import os
+import sys
 import setuptools
+from setuptools.command.build_ext import build_ext
 
 
 def get_version():
@@ -13,6 +17,39 @@ def get_version():
             return line.split("\"")[1]
 
 
+def get_library_suffix():
+    """
+    Gets the shared library suffix of the current platform.
+
+    :return: str
+    """
+    if sys.platform == "win32":
+        return ".dll"
+    if sys.platform == "darwin":
+        return ".dylib"
+    return ".so"
+
+
+class BuildLibrary(build_ext):
+    """Builds the C sources as plain shared library which is loaded with ctypes."""
+    def get_export_symbols(self, ext):
+        """Exports the C functions instead of a Python module init function."""
+        return ext.export_symbols
+
+    def get_ext_filename(self, ext_name):
+        """Uses the platform library name instead of the Python extension name."""
+        return os.path.join(*ext_name.split(".")) + get_library_suffix()
+
+    def build_extensions(self):
+        """Adds compiler specific optimization flags."""
+        for ext in self.extensions:
+            if self.compiler.compiler_type == "msvc":
+                ext.extra_compile_args = ["/O2"]
+            else:
+                ext.extra_compile_args = ["-O3", "-std=c99"]
+        build_ext.build_extensions(self)
+
+
 setuptools.setup(
     name="maze",
     version=get_version(),
@@ -25,9 +62,28 @@ setuptools.setup(
         "numpy",
         "Pillow"
     ],
-    package_data={
-        "maze": [
-            "bin/maze64.dll"
-        ]
+    ext_modules=[
+        setuptools.Extension(
+            "maze.libmaze",
+            sources=sorted(glob.glob("maze/src/*.c")),
+            depends=sorted(glob.glob("maze/src/*.h")),
+            export_symbols=[
+                "recursive_backtracking",
+                "hunt_and_kill",
+                "eller",
+                "sidewinder",
+                "binary_tree",
+                "prim",
+                "kruskal",
+                "depth_first_search",
+                "breadth_first_search",
+                "a_star",
+                "bidirectional_search"
+            ],
+            optional=True
+        )
+    ],
+    cmdclass={
+        "build_ext": BuildLibrary
     }
 )
@@ -1,5 +1,6 @@
 from maze import *
 from pyprocessing import *
+import maze.utils as utils
 
 # Configuration
 row_count = 35
@@ -14,8 +15,9 @@ m = Maze()
 m.create(row_count, col_count, create_algorithm)
 row_count_with_walls = 2 * row_count + 1
 col_count_with_walls = 2 * col_count + 1
+image = utils.to_rgb(m.maze)  # RGB image with walls, value of passages is [255, 255, 255]
 
-visited_cells = m.maze.copy()  # List of visited cells, value of visited cell is [0, 0, 0]
+visited_cells = image.copy()  # List of visited cells, value of visited cell is [0, 0, 0]
 stack = collections.deque()  # List of visited cells [(x, y), ...]
 
 # Define start and end
@@ -85,11 +87,11 @@ def backtrack():
 
 def draw_maze():
     """Draws the maze."""
-    global m, row_count_with_walls, col_count_with_walls, scale
+    global image, row_count_with_walls, col_count_with_walls, scale
     fill(255)
     for x in range(row_count_with_walls):
         for y in range(col_count_with_walls):
-            if m.maze[x, y, 0] == 255:
+            if image[x, y, 0] == 255:
                 rect(y * scale, x * scale, scale, scale)
 
 